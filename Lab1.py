@@ -1,9 +1,121 @@
-from math import sqrt
+from math import sqrt, hypot, isqrt, log
+from array import array
+from heapq import heappush, heappushpop, nsmallest
+from itertools import repeat, count
+from operator import add, sub, mul, attrgetter, itemgetter
 
 WIDTH = 12
 HEIGHT = 24
 
+
+class Grid:
+    FROZEN_TABLE_LIMIT = 1 << 16
+    __slots__ = ('_width', '_height', '_xs', '_ys', '_bound', '_frozen_table', '_typecode')
+
+    def __init__(self, width: int = WIDTH, height: int = HEIGHT):
+        if not isinstance(width, int) or not isinstance(height, int):
+            raise TypeError("Размеры сетки должны быть целыми числами")
+        if width < 0 or height < 0:
+            raise ValueError("Размеры сетки не могут быть отрицательными")
+        self._width = width
+        self._height = height
+        self._xs = range(width + 1)
+        self._ys = range(height + 1)
+        self._bound = {}
+        self._frozen_table = None
+        # самый узкий тип array, вмещающий любую координату; для сеток шире int64 массивы не годятся
+        largest = max(width, height)
+        self._typecode = 'i' if largest < 1 << 31 else 'q' if largest < 1 << 63 else None
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @property
+    def typecode(self) -> str | None:
+        return self._typecode
+
+    def check_x(self, val: int) -> int:
+        if isinstance(val, int):
+            if val in self._xs:
+                return val
+            raise ValueError(f"x должен быть в диапазоне [0, {self._width}]")
+        raise TypeError("x должен быть целым числом")
+
+    def check_y(self, val: int) -> int:
+        if isinstance(val, int):
+            if val in self._ys:
+                return val
+            raise ValueError(f"y должен быть в диапазоне [0, {self._height}]")
+        raise TypeError("y должен быть целым числом")
+
+    def contains(self, x: int, y: int) -> bool:
+        return x in self._xs and y in self._ys
+
+    def validate_many(self, xs, ys) -> None:
+        if len(xs) != len(ys):
+            raise ValueError("Количество координат x и y должно совпадать")
+        if not all(map(isinstance, xs, repeat(int))):
+            raise TypeError("x должен быть целым числом")
+        if not all(map(isinstance, ys, repeat(int))):
+            raise TypeError("y должен быть целым числом")
+        self._check_ranges(xs, ys)
+
+    def _check_ranges(self, xs, ys) -> None:
+        if len(xs) and (min(xs) < 0 or max(xs) > self._width):
+            raise ValueError(f"x должен быть в диапазоне [0, {self._width}]")
+        if len(ys) and (min(ys) < 0 or max(ys) > self._height):
+            raise ValueError(f"y должен быть в диапазоне [0, {self._height}]")
+
+    def bind(self, cls: type) -> type:
+        if cls._grid is self:
+            return cls
+        bound = self._bound.get(cls)
+        if bound is None:
+            bound = type(cls.__name__, (cls,), {'__slots__': (), '_grid': self})
+            self._bound[cls] = bound
+        return bound
+
+    def _frozen_point(self, x: int, y: int) -> 'FrozenPoint2d':
+        table = self._frozen_table
+        if table is None:
+            # таблица всех точек заполняется заранее только для небольших сеток,
+            # на больших точки создаются по мере обращения
+            if (self._width + 1) * (self._height + 1) <= self.FROZEN_TABLE_LIMIT:
+                frozen_cls = self.bind(FrozenPoint2d)
+                table = [[frozen_cls(px, py) for py in self._ys] for px in self._xs]
+            else:
+                table = {}
+            self._frozen_table = table
+        if table.__class__ is list:
+            return table[x][y]
+        point = table.get((x, y))
+        if point is None:
+            point = table[x, y] = self.bind(FrozenPoint2d)(x, y)
+        return point
+
+    def __eq__(self, other):
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return self._width == other._width and self._height == other._height
+
+    def __hash__(self):
+        return hash((self._width, self._height))
+
+    def __repr__(self):
+        return f"Grid({self._width}, {self._height})"
+
+
+DEFAULT_GRID = Grid(WIDTH, HEIGHT)
+
 class Point2d:
+    __slots__ = ('_x', '_y')
+    _grid = DEFAULT_GRID
+
     def __init__(self, x: int, y: int):
         self.x = x
         self.y = y
@@ -14,13 +126,10 @@ class Point2d:
 
     @x.setter
     def x(self, val: int) -> None:
-        if isinstance(val, int):
-            if 0 <= val <= WIDTH:
-                self._x = val
-            else:
-                raise ValueError(f"x должен быть в диапазоне [0, {WIDTH}]")
+        if val.__class__ is int and val in self._grid._xs:
+            self._x = val
         else:
-            raise TypeError("x должен быть целым числом")
+            self._x = self._grid.check_x(val)
 
     @property
     def y(self) -> int:
@@ -28,13 +137,17 @@ class Point2d:
 
     @y.setter
     def y(self, val: int) -> None:
-        if isinstance(val, int):
-            if 0 <= val <= HEIGHT:
-                self._y = val
-            else:
-                raise ValueError(f"y должен быть в диапазоне [0, {HEIGHT}]")
+        if val.__class__ is int and val in self._grid._ys:
+            self._y = val
         else:
-            raise TypeError("y должен быть целым числом")
+            self._y = self._grid.check_y(val)
+
+    @classmethod
+    def of(cls, x: int, y: int) -> 'FrozenPoint2d':
+        grid = cls._grid
+        if type(x) is int and type(y) is int and x in grid._xs and y in grid._ys:
+            return grid._frozen_point(x, y)
+        return grid._frozen_point(grid.check_x(x), grid.check_y(y))
 
     def __eq__(self, other):
         if not isinstance(other, Point2d):
@@ -48,24 +161,74 @@ class Point2d:
         return f"Point2d({self._x}, {self._y})"
 
 
+class FrozenPoint2d(Point2d):
+    __slots__ = ('_hash',)
+
+    def __init__(self, x: int, y: int):
+        Point2d.x.fset(self, x)
+        Point2d.y.fset(self, y)
+        self._hash = hash((self._x, self._y))
+
+    @property
+    def x(self) -> int:
+        return self._x
+
+    @x.setter
+    def x(self, val: int) -> None:
+        raise AttributeError("FrozenPoint2d неизменяема, используйте Point2d")
+
+    @property
+    def y(self) -> int:
+        return self._y
+
+    @y.setter
+    def y(self, val: int) -> None:
+        raise AttributeError("FrozenPoint2d неизменяема, используйте Point2d")
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        return Point2d.__eq__(self, other)
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return f"Point2d.of({self._x}, {self._y})"
+
+
 class Vector2d:
+    __slots__ = ('_x', '_y')
+    _grid = DEFAULT_GRID
+
     def __init__(self, x: int, y: int):
         self.x = x
         self.y = y
 
+    @classmethod
+    def _from_trusted(cls, x: int, y: int) -> 'Vector2d':
+        # x и y получены из координат других объектов и уже являются целыми,
+        # поэтому проверяется только диапазон
+        grid = cls._grid
+        if x not in grid._xs:
+            raise ValueError(f"x должен быть в диапазоне [0, {grid.width}]")
+        if y not in grid._ys:
+            raise ValueError(f"y должен быть в диапазоне [0, {grid.height}]")
+        obj = object.__new__(cls)
+        obj._x = x
+        obj._y = y
+        return obj
+
     @property
     def x(self) -> int:
         return self._x
 
     @x.setter
     def x(self, val: int) -> None:
-        if isinstance(val, int):
-            if 0 <= val <= WIDTH:
-                self._x = val
-            else:
-                raise ValueError(f"x должен быть в диапазоне [0, {WIDTH}]")
+        if val.__class__ is int and val in self._grid._xs:
+            self._x = val
         else:
-            raise TypeError("x должен быть целым числом")
+            self._x = self._grid.check_x(val)
 
     @property
     def y(self) -> int:
@@ -73,20 +236,15 @@ class Vector2d:
 
     @y.setter
     def y(self, val: int) -> None:
-        if isinstance(val, int):
-            if 0 <= val <= HEIGHT:
-                self._y = val
-            else:
-                raise ValueError(f"y должен быть в диапазоне [0, {HEIGHT}]")
+        if val.__class__ is int and val in self._grid._ys:
+            self._y = val
         else:
-            raise TypeError("y должен быть целым числом")
+            self._y = self._grid.check_y(val)
 
     @classmethod
     def from_point(cls, start: Point2d, end: Point2d):
         if isinstance(start, Point2d) and  isinstance(end, Point2d):
-            x = end.x - start.x
-            y = end.y - start.y
-            return cls(x, y)
+            return cls._from_trusted(end._x - start._x, end._y - start._y)
         raise TypeError(f"Метод принимает на вход объекты Point2d")
 
 
@@ -106,13 +264,13 @@ class Vector2d:
         if not isinstance(v1, Vector2d) or not isinstance(v2, Vector2d):
             raise TypeError("Ожидаются два объекта типа Vector2d")
         cross_product = v1._x * v2._y - v1._y * v2._x
-        return Vector2d(0, cross_product)
+        return cls._from_trusted(0, cross_product)
 
     def cross_dynamic(self, other: 'Vector2d') -> 'Vector2d':
         if not isinstance(other, Vector2d):
             raise TypeError("Ожидаются два объекта типа Vector2d")
         cross_product = self._x * other._y - self._y * other._x
-        return Vector2d(0, cross_product)
+        return type(self)._from_trusted(0, cross_product)
 
     @classmethod
     def mixed_product(cls, v1, v2, v3) -> int:
@@ -145,7 +303,7 @@ class Vector2d:
     def __mul__(self, number):
         if not isinstance(number, int):
             raise TypeError("Ожидается целое число")
-        return Vector2d(self._x * number, self._y * number)
+        return type(self)._from_trusted(self._x * number, self._y * number)
 
     def __truediv__(self, number):
         if not isinstance(number, int):
@@ -154,17 +312,17 @@ class Vector2d:
             raise ValueError("Не поддерживается деление на ноль")
         if self.x % number == 0 or self.y % number == 0:
             raise ValueError("Невозможно разделить vector на переданное число number")
-        return Vector2d(self.x // number, self.y // number)
+        return type(self)._from_trusted(self._x // number, self._y // number)
 
     def __add__(self, other):
         if not isinstance(other, Vector2d):
             raise TypeError("Ожидается целое число")
-        return Vector2d(self._x + other._x, self._y + other._y)
+        return type(self)._from_trusted(self._x + other._x, self._y + other._y)
 
     def __sub__(self, other):
         if not isinstance(other, Vector2d):
             raise TypeError("Ожидается целое число")
-        return Vector2d(self.x - other._x, self.y - other._y)
+        return type(self)._from_trusted(self._x - other._x, self._y - other._y)
 
     def __iter__(self):
         return iter((self.x, self.y))
@@ -183,6 +341,475 @@ class Vector2d:
     def __repr__(self):
         return f"Vector2d({self._x}, {self._y})"
 
+
+class Vector2dArray:
+    __slots__ = ('_xs', '_ys')
+    _grid = DEFAULT_GRID
+
+    def __init__(self, xs=(), ys=()):
+        try:
+            xs = list(xs)
+            ys = list(ys)
+        except TypeError:
+            raise TypeError("Ожидаются последовательности целых чисел")
+        self._grid.validate_many(xs, ys)
+        self._set(xs, ys)
+
+    def _set(self, xs: list, ys: list) -> None:
+        typecode = self._grid._typecode
+        if typecode is None:
+            self._xs, self._ys = xs, ys
+        else:
+            self._xs = array(typecode, xs)
+            self._ys = array(typecode, ys)
+
+    @classmethod
+    def _from_lists(cls, xs: list, ys: list) -> 'Vector2dArray':
+        cls._grid._check_ranges(xs, ys)
+        obj = cls.__new__(cls)
+        obj._set(xs, ys)
+        return obj
+
+    @classmethod
+    def from_vectors(cls, vectors) -> 'Vector2dArray':
+        vectors = list(vectors)
+        if not all(map(isinstance, vectors, repeat(Vector2d))):
+            raise TypeError("Ожидаются объекты типа Vector2d")
+        return cls._from_lists(list(map(attrgetter('_x'), vectors)),
+                               list(map(attrgetter('_y'), vectors)))
+
+    @classmethod
+    def from_points(cls, starts, ends) -> 'Vector2dArray':
+        starts = list(starts)
+        ends = list(ends)
+        if len(starts) != len(ends):
+            raise ValueError("Количество начальных и конечных точек должно совпадать")
+        if (not all(map(isinstance, starts, repeat(Point2d)))
+                or not all(map(isinstance, ends, repeat(Point2d)))):
+            raise TypeError(f"Метод принимает на вход объекты Point2d")
+        get_x = attrgetter('_x')
+        get_y = attrgetter('_y')
+        xs = list(map(sub, map(get_x, ends), map(get_x, starts)))
+        ys = list(map(sub, map(get_y, ends), map(get_y, starts)))
+        return cls._from_lists(xs, ys)
+
+    @property
+    def xs(self) -> array | list[int]:
+        return self._xs
+
+    @property
+    def ys(self) -> array | list[int]:
+        return self._ys
+
+    def to_vectors(self) -> list[Vector2d]:
+        return list(map(self._grid.bind(Vector2d)._from_trusted, self._xs, self._ys))
+
+    def to_points(self) -> list[Point2d]:
+        return list(map(self._grid.bind(Point2d), self._xs, self._ys))
+
+    def _check_other(self, other) -> None:
+        if not isinstance(other, Vector2dArray):
+            raise TypeError("Ожидается объект типа Vector2dArray")
+        if len(other) != len(self):
+            raise ValueError("Массивы векторов должны быть одинаковой длины")
+
+    def dot(self, other: 'Vector2dArray') -> array | list[int]:
+        self._check_other(other)
+        products = map(add, map(mul, self._xs, other._xs), map(mul, self._ys, other._ys))
+        # скалярное произведение 32-битных координат всегда помещается в int64, более широких — нет
+        if self._grid._typecode == 'i':
+            return array('q', products)
+        return list(products)
+
+    def cross(self, other: 'Vector2dArray') -> 'Vector2dArray':
+        self._check_other(other)
+        ys = list(map(sub, map(mul, self._xs, other._ys),
+                      map(mul, self._ys, other._xs)))
+        return self._from_lists([0] * len(ys), ys)
+
+    def __abs__(self) -> array:
+        return array('d', map(hypot, self._xs, self._ys))
+
+    def __mul__(self, number):
+        if not isinstance(number, int):
+            raise TypeError("Ожидается целое число")
+        return self._from_lists(list(map(mul, self._xs, repeat(number))),
+                                list(map(mul, self._ys, repeat(number))))
+
+    def __add__(self, other):
+        self._check_other(other)
+        return self._from_lists(list(map(add, self._xs, other._xs)),
+                                list(map(add, self._ys, other._ys)))
+
+    def __sub__(self, other):
+        self._check_other(other)
+        return self._from_lists(list(map(sub, self._xs, other._xs)),
+                                list(map(sub, self._ys, other._ys)))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._from_lists(list(self._xs[index]), list(self._ys[index]))
+        return self._grid.bind(Vector2d)._from_trusted(self._xs[index], self._ys[index])
+
+    def __iter__(self):
+        return map(self._grid.bind(Vector2d)._from_trusted, self._xs, self._ys)
+
+    def __len__(self):
+        return len(self._xs)
+
+    def __eq__(self, other):
+        if not isinstance(other, Vector2dArray):
+            return NotImplemented
+        return self._xs == other._xs and self._ys == other._ys
+
+    def __repr__(self):
+        return f"Vector2dArray({list(self._xs)}, {list(self._ys)})"
+
+
+class _GridBuckets:
+    def __init__(self, grid: Grid):
+        self._width = grid.width
+        self._height = grid.height
+        self._stride = grid.height + 1
+        self._cells: list = [None] * ((grid.width + 1) * self._stride)
+
+    def add(self, x: int, y: int, point: Point2d) -> None:
+        index = x * self._stride + y
+        cell = self._cells[index]
+        if cell is None:
+            self._cells[index] = [point]
+        else:
+            cell.append(point)
+
+    def remove(self, x: int, y: int, point: Point2d) -> bool:
+        cell = self._cells[x * self._stride + y]
+        if not cell:
+            return False
+        cell.remove(point)
+        return True
+
+    def points(self):
+        for cell in self._cells:
+            if cell:
+                yield from cell
+
+    def rect(self, x0: int, y0: int, x1: int, y1: int) -> list:
+        x0, y0 = max(x0, 0), max(y0, 0)
+        x1, y1 = min(x1, self._width), min(y1, self._height)
+        result = []
+        cells = self._cells
+        for x in range(x0, x1 + 1):
+            base = x * self._stride
+            for cell in cells[base + y0:base + y1 + 1]:
+                if cell:
+                    result.extend(cell)
+        return result
+
+    def within(self, cx: int, cy: int, radius: float) -> list:
+        r2 = radius * radius
+        reach = int(radius)
+        result = []
+        cells = self._cells
+        for x in range(max(cx - reach, 0), min(cx + reach, self._width) + 1):
+            # все клетки столбца в пределах span лежат внутри круга,
+            # поэтому расстояние до каждой точки не пересчитывается
+            span = isqrt(int(r2 - (x - cx) ** 2))
+            base = x * self._stride
+            for cell in cells[base + max(cy - span, 0):base + min(cy + span, self._height) + 1]:
+                if cell:
+                    result.extend(cell)
+        return result
+
+    def nearest(self, cx: int, cy: int, k: int) -> list:
+        found = []
+        order = count()
+        cells = self._cells
+        max_ring = max(cx, self._width - cx, cy, self._height - cy)
+        for ring in range(max_ring + 1):
+            for x, y in self._ring(cx, cy, ring):
+                cell = cells[x * self._stride + y]
+                if cell:
+                    d2 = (x - cx) ** 2 + (y - cy) ** 2
+                    for point in cell:
+                        found.append((d2, next(order), point))
+            # непросмотренные клетки лежат не ближе ring + 1
+            if len(found) >= k and nsmallest(k, found)[-1][0] <= (ring + 1) ** 2:
+                break
+        return [point for _, _, point in nsmallest(k, found)]
+
+    def _ring(self, cx: int, cy: int, ring: int):
+        if ring == 0:
+            if 0 <= cx <= self._width and 0 <= cy <= self._height:
+                yield cx, cy
+            return
+        x0, x1 = max(cx - ring, 0), min(cx + ring, self._width)
+        for y in (cy - ring, cy + ring):
+            if 0 <= y <= self._height:
+                for x in range(x0, x1 + 1):
+                    yield x, y
+        y0, y1 = max(cy - ring + 1, 0), min(cy + ring - 1, self._height)
+        for x in (cx - ring, cx + ring):
+            if 0 <= x <= self._width:
+                for y in range(y0, y1 + 1):
+                    yield x, y
+
+
+class _KdTree:
+    # узел: [x, y, point, left, right, alive, seq]
+    ALPHA = 0.75
+
+    def __init__(self):
+        self._root = None
+        self._alive = 0
+        self._dead = 0
+        self._order = count()
+
+    def load(self, items: list) -> None:
+        items = [(node[0], node[1], node[2]) for node in self._nodes()] + items
+        self._root = self._build(items, 0)
+        self._alive = len(items)
+        self._dead = 0
+
+    def _build(self, items: list, depth: int):
+        if not items:
+            return None
+        items.sort(key=itemgetter(depth & 1))
+        mid = len(items) // 2
+        x, y, point = items[mid]
+        return [x, y, point, self._build(items[:mid], depth + 1),
+                self._build(items[mid + 1:], depth + 1), True, next(self._order)]
+
+    def _nodes(self):
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            if node[5]:
+                yield node
+            stack.append(node[3])
+            stack.append(node[4])
+
+    def points(self):
+        for node in self._nodes():
+            yield node[2]
+
+    def add(self, x: int, y: int, point: Point2d) -> None:
+        new = [x, y, point, None, None, True, next(self._order)]
+        self._alive += 1
+        if self._root is None:
+            self._root = new
+            return
+        path = []
+        node, depth = self._root, 0
+        while True:
+            path.append((node, depth))
+            side = 3 if (x, y)[depth & 1] < node[depth & 1] else 4
+            if node[side] is None:
+                node[side] = new
+                break
+            node, depth = node[side], depth + 1
+        # вставка в отсортированном порядке вытягивает дерево в цепочку,
+        # поэтому слишком глубокая ветка перестраивается, как в scapegoat-дереве
+        if len(path) > log(self._alive + self._dead, 1 / self.ALPHA) + 1:
+            self._rebalance(path, new)
+
+    def _rebalance(self, path: list, new: list) -> None:
+        child, child_size = new, 1
+        for index in range(len(path) - 1, -1, -1):
+            node, depth = path[index]
+            sibling = node[4] if node[3] is child else node[3]
+            size = child_size + self._count(sibling) + 1
+            if child_size > self.ALPHA * size:
+                items = [(n[0], n[1], n[2]) for n in self._subtree(node) if n[5]]
+                self._dead -= size - len(items)
+                subtree = self._build(items, depth)
+                if index == 0:
+                    self._root = subtree
+                else:
+                    parent = path[index - 1][0]
+                    parent[3 if parent[3] is node else 4] = subtree
+                return
+            child, child_size = node, size
+        self.load([])
+
+    @staticmethod
+    def _subtree(root):
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if node is not None:
+                yield node
+                stack.append(node[3])
+                stack.append(node[4])
+
+    def _count(self, root) -> int:
+        return sum(1 for _ in self._subtree(root))
+
+    def remove(self, x: int, y: int, point: Point2d) -> bool:
+        stack = [(self._root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if node is None:
+                continue
+            if node[5] and node[0] == x and node[1] == y and node[2] == point:
+                node[5] = False
+                self._alive -= 1
+                self._dead += 1
+                if self._dead > self._alive:
+                    self.load([])
+                return True
+            key = (x, y)[depth & 1]
+            if key <= node[depth & 1]:
+                stack.append((node[3], depth + 1))
+            if key >= node[depth & 1]:
+                stack.append((node[4], depth + 1))
+        return False
+
+    def rect(self, x0: int, y0: int, x1: int, y1: int) -> list:
+        result = []
+        lo, hi = (x0, y0), (x1, y1)
+        stack = [(self._root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if node is None:
+                continue
+            if node[5] and x0 <= node[0] <= x1 and y0 <= node[1] <= y1:
+                result.append(node[2])
+            axis = depth & 1
+            if lo[axis] <= node[axis]:
+                stack.append((node[3], depth + 1))
+            if hi[axis] >= node[axis]:
+                stack.append((node[4], depth + 1))
+        return result
+
+    def within(self, cx: int, cy: int, radius: float) -> list:
+        result = []
+        r2 = radius * radius
+        center = (cx, cy)
+        stack = [(self._root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if node is None:
+                continue
+            if node[5] and (node[0] - cx) ** 2 + (node[1] - cy) ** 2 <= r2:
+                result.append(node[2])
+            axis = depth & 1
+            if center[axis] - radius <= node[axis]:
+                stack.append((node[3], depth + 1))
+            if center[axis] + radius >= node[axis]:
+                stack.append((node[4], depth + 1))
+        return result
+
+    def nearest(self, cx: int, cy: int, k: int) -> list:
+        heap = []
+        center = (cx, cy)
+        # в стеке вместе с узлом лежит квадрат расстояния до его полуплоскости
+        stack = [(self._root, 0, 0)]
+        while stack:
+            node, depth, bound = stack.pop()
+            if node is None or (len(heap) == k and bound > -heap[0][0]):
+                continue
+            if node[5]:
+                entry = (-((node[0] - cx) ** 2 + (node[1] - cy) ** 2), -node[6], node[2])
+                if len(heap) < k:
+                    heappush(heap, entry)
+                elif entry[:2] > heap[0][:2]:
+                    heappushpop(heap, entry)
+            axis = depth & 1
+            diff = center[axis] - node[axis]
+            near, far = (node[3], node[4]) if diff < 0 else (node[4], node[3])
+            stack.append((far, depth + 1, max(bound, diff * diff)))
+            stack.append((near, depth + 1, bound))
+        return [point for _, _, point in sorted(heap, key=lambda e: (-e[0], -e[1]))]
+
+
+class PointIndex:
+    BUCKET_CELL_LIMIT = 1 << 18
+
+    def __init__(self, points=(), grid: Grid = DEFAULT_GRID):
+        if not isinstance(grid, Grid):
+            raise TypeError("Ожидается объект типа Grid")
+        self._grid = grid
+        self._size = 0
+        if (grid.width + 1) * (grid.height + 1) <= self.BUCKET_CELL_LIMIT:
+            self._storage = _GridBuckets(grid)
+        else:
+            self._storage = _KdTree()
+        self.load(points)
+
+    @property
+    def grid(self) -> Grid:
+        return self._grid
+
+    def _coords(self, point: Point2d) -> tuple[int, int]:
+        if not isinstance(point, Point2d):
+            raise TypeError("Ожидается объект типа Point2d")
+        return self._grid.check_x(point._x), self._grid.check_y(point._y)
+
+    def load(self, points) -> None:
+        items = [(*self._coords(point), point) for point in points]
+        if isinstance(self._storage, _KdTree):
+            self._storage.load(items)
+        else:
+            for x, y, point in items:
+                self._storage.add(x, y, point)
+        self._size += len(items)
+
+    def insert(self, point: Point2d) -> None:
+        x, y = self._coords(point)
+        self._storage.add(x, y, point)
+        self._size += 1
+
+    def remove(self, point: Point2d) -> None:
+        x, y = self._coords(point)
+        if not self._storage.remove(x, y, point):
+            raise ValueError(f"Точка {point} отсутствует в индексе")
+        self._size -= 1
+
+    def within(self, center: Point2d, radius: float) -> list[Point2d]:
+        if not isinstance(center, Point2d):
+            raise TypeError("Ожидается объект типа Point2d")
+        if not isinstance(radius, (int, float)):
+            raise TypeError("Радиус должен быть числом")
+        if radius != radius:
+            raise ValueError("Радиус не может быть NaN")
+        if radius < 0:
+            raise ValueError("Радиус не может быть отрицательным")
+        # круг больше диагонали сетки уже накрывает все точки, а огромный радиус переполнил бы int()
+        radius = min(radius, hypot(self._grid.width, self._grid.height))
+        return self._storage.within(center._x, center._y, radius)
+
+    def nearest(self, center: Point2d, k: int = 1) -> list[Point2d]:
+        if not isinstance(center, Point2d):
+            raise TypeError("Ожидается объект типа Point2d")
+        if not isinstance(k, int):
+            raise TypeError("k должен быть целым числом")
+        if k <= 0 or not self._size:
+            return []
+        return self._storage.nearest(center._x, center._y, k)
+
+    def in_rect(self, start: Point2d, end: Point2d) -> list[Point2d]:
+        if not isinstance(start, Point2d) or not isinstance(end, Point2d):
+            raise TypeError(f"Метод принимает на вход объекты Point2d")
+        x0, x1 = sorted((start._x, end._x))
+        y0, y1 = sorted((start._y, end._y))
+        return self._storage.rect(x0, y0, x1, y1)
+
+    def __contains__(self, point):
+        if not isinstance(point, Point2d):
+            return False
+        return point in self._storage.rect(point._x, point._y, point._x, point._y)
+
+    def __iter__(self):
+        return self._storage.points()
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        return f"PointIndex({self._size} points, {self._grid!r})"
+
 if __name__ == "__main__":
     p1 = Point2d(1,1)
     p2 = Point2d(0, 0)
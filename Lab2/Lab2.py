@@ -1,5 +1,14 @@
+from collections import OrderedDict
+from collections.abc import Mapping
 from enum import Enum
-import json, os, sys
+from functools import lru_cache
+from typing import Callable, TextIO
+import io, json, os, sys
+
+try:
+    from .binary_font import BinaryFont
+except ImportError:
+    from binary_font import BinaryFont
 
 
 class Color(Enum):
@@ -15,79 +24,309 @@ class Color(Enum):
     RESET = "\033[0m"
 
 
+DEFAULT_FONT = 'default'
+
+
+def load_font_file(file_path: str) -> Mapping[str, list[str]]:
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"Файл '{file_path}' не найден.")
+
+    if file_path.endswith('.bfnt'):
+        return BinaryFont(file_path)
+
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Ошибка при разборе JSON из файла '{file_path}': {e}")
+    except Exception as e:
+        raise RuntimeError(f"Не удалось загрузить шрифты: {e}")
+
+
+def _font_height(font: Mapping[str, list[str]]) -> int:
+    height = getattr(font, 'height', None)
+    if height is None:
+        height = len(next(iter(font.values()), []))
+    return height
+
+
+def _decoded_size(font: Mapping[str, list[str]]) -> int:
+    # оценка памяти, занятой разобранным шрифтом: словарь, списки строк и сами строки
+    size = sys.getsizeof(font)
+    for ch, rows in font.items():
+        size += sys.getsizeof(ch) + sys.getsizeof(rows) + sum(map(sys.getsizeof, rows))
+    return size
+
+
+class _ChainedFont(Mapping):
+    def __init__(self, registry: 'FontRegistry', chain: tuple[str, ...]) -> None:
+        self._registry = registry
+        self._chain = chain
+        self._cache: dict[str, list[str]] = {}
+
+    @property
+    def height(self) -> int:
+        return _font_height(self._registry.get(self._chain[0]))
+
+    def __getitem__(self, ch: str) -> list[str]:
+        rows = self._cache.get(ch)
+        if rows is None:
+            for name in self._chain:
+                font = self._registry.get(name)
+                if ch in font:
+                    rows = self._cache[ch] = self._fit(name, ch, font[ch])
+                    break
+            else:
+                raise KeyError(ch)
+        return rows
+
+    def _fit(self, name: str, ch: str, rows: list[str]) -> list[str]:
+        # строки баннера склеиваются через zip, поэтому глиф из запасного шрифта
+        # должен иметь ту же высоту, что и основной шрифт
+        height = self.height
+        if len(rows) == height:
+            return rows
+        if len(rows) > height:
+            raise ValueError(f"Глиф '{ch}' шрифта '{name}' выше основного шрифта '{self._chain[0]}' "
+                             f"({len(rows)} > {height})")
+        width = len(rows[0]) if rows else 0
+        return ['0' * width] * (height - len(rows)) + list(rows)
+
+    def __iter__(self):
+        return iter(dict.fromkeys(ch for name in self._chain for ch in self._registry.get(name)))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class FontRegistry:
+    def __init__(self, memory_budget: int | None = None) -> None:
+        self._paths: dict[str, str] = {}
+        self._fallbacks: dict[str, tuple[str, ...]] = {}
+        self._loaded: OrderedDict[str, tuple[Mapping, int]] = OrderedDict()
+        self._chains: dict[str, _ChainedFont] = {}
+        self._memory_budget = memory_budget
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def memory_budget(self) -> int | None:
+        return self._memory_budget
+
+    @memory_budget.setter
+    def memory_budget(self, value: int | None) -> None:
+        if value is not None and (not isinstance(value, int) or value < 0):
+            raise ValueError("Бюджет памяти должен быть неотрицательным целым числом или None")
+        self._memory_budget = value
+        self._evict()
+
+    @property
+    def memory_used(self) -> int:
+        return sum(self._size(name) for name in self._loaded)
+
+    def _size(self, name: str) -> int:
+        # у бинарного шрифта объём растёт по мере разбора глифов, поэтому он запрашивается заново
+        font, size = self._loaded[name]
+        return getattr(font, 'memory_size', size)
+
+    def add_invalidation_listener(self, callback: Callable[[], None]) -> None:
+        self._listeners.append(callback)
+
+    def _invalidate(self) -> None:
+        # разрешённые цепочки и внешние кэши держат ссылки на глифы, без сброса память не освободится
+        self._chains.clear()
+        for callback in self._listeners:
+            callback()
+
+    @property
+    def loaded(self) -> list[str]:
+        return list(self._loaded)
+
+    def registered(self) -> dict[str, tuple[str, tuple[str, ...]]]:
+        return {name: (path, self._fallbacks[name]) for name, path in self._paths.items()}
+
+    def register(self, name: str, file_path: str, fallbacks: tuple[str, ...] = ()) -> None:
+        self._paths[name] = file_path
+        self._fallbacks[name] = tuple(fallbacks)
+        self._unload(name)
+        self._invalidate()
+
+    def get(self, name: str) -> Mapping[str, list[str]]:
+        entry = self._loaded.get(name)
+        if entry is not None:
+            self._loaded.move_to_end(name)
+            return entry[0]
+        file_path = self._paths.get(name)
+        if file_path is None:
+            raise KeyError(f"Шрифт '{name}' не зарегистрирован")
+        font = load_font_file(file_path)
+        size = 0 if hasattr(font, 'memory_size') else _decoded_size(font)
+        self._loaded[name] = (font, size)
+        self._evict(keep=name)
+        return font
+
+    def resolve(self, name: str) -> _ChainedFont:
+        chained = self._chains.get(name)
+        if chained is None:
+            if name not in self._paths:
+                raise KeyError(f"Шрифт '{name}' не зарегистрирован")
+            chain = []
+            pending = [name]
+            while pending:
+                current = pending.pop(0)
+                if current in chain or current not in self._paths:
+                    continue
+                chain.append(current)
+                pending.extend(self._fallbacks[current])
+            chained = self._chains[name] = _ChainedFont(self, tuple(chain))
+        return chained
+
+    def _unload(self, name: str) -> bool:
+        return self._loaded.pop(name, None) is not None
+
+    def _evict(self, keep: str | None = None) -> None:
+        if self._memory_budget is None:
+            return
+        used = self.memory_used
+        evicted = False
+        for name in list(self._loaded):
+            if used <= self._memory_budget:
+                break
+            if name != keep:
+                used -= self._size(name)
+                evicted = self._unload(name) or evicted
+        if evicted:
+            self._invalidate()
+
+
+class _GlyphRows(dict):
+    def __init__(self, fonts: Mapping[str, list[str]], symbol: str) -> None:
+        super().__init__()
+        self._fonts = fonts
+        self._table = str.maketrans({'1': symbol, '0': ' '})
+
+    def __missing__(self, ch: str) -> tuple[str, ...]:
+        rows = tuple(row.translate(self._table) for row in self._fonts[ch])
+        self[ch] = rows
+        return rows
+
+
+def _default_font_path() -> str:
+    base_dir = os.path.dirname(__file__)
+    binary_path = os.path.join(base_dir, 'Fonts.bfnt')
+    if os.path.exists(binary_path):
+        return binary_path
+    return os.path.join(base_dir, 'Fonts.json')
+
+
 class FontLoader:
-    _fonts = None
+    registry = FontRegistry()
+    registry.register(DEFAULT_FONT, _default_font_path())
+    _glyphs: dict[tuple[str, str], dict[str, tuple[str, ...]]] = {}
 
     @classmethod
-    def get_fonts(cls) -> dict:
-        if cls._fonts is None:
-            base_dir = os.path.dirname(__file__)
-            file_path = os.path.join(base_dir, 'Fonts.json')
+    def _invalidate(cls) -> None:
+        cls._glyphs.clear()
+        _render_lines.cache_clear()
 
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"Файл '{file_path}' не найден.")
+    @classmethod
+    def get_fonts(cls, font: str = DEFAULT_FONT) -> Mapping[str, list[str]]:
+        return cls.registry.get(font)
 
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    cls._fonts = json.load(f)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Ошибка при разборе JSON из файла '{file_path}': {e}")
-            except Exception as e:
-                raise RuntimeError(f"Не удалось загрузить шрифты: {e}")
+    @classmethod
+    def register_font(cls, name: str, file_path: str, fallbacks: tuple[str, ...] = ()) -> None:
+        cls.registry.register(name, file_path, fallbacks)
 
-        return cls._fonts
+    @classmethod
+    def get_glyphs(cls, symbol: str, font: str = DEFAULT_FONT) -> dict[str, tuple[str, ...]]:
+        glyphs = cls._glyphs.get((font, symbol))
+        if glyphs is None:
+            glyphs = cls._glyphs[font, symbol] = _GlyphRows(cls.registry.resolve(font), symbol)
+        return glyphs
+
+    @classmethod
+    def render_lines(cls, text: str, symbol: str, font: str = DEFAULT_FONT) -> tuple[str, ...]:
+        return _render_lines(text, symbol, font)
+
+
+@lru_cache(maxsize=1024)
+def _render_lines(text: str, symbol: str, font: str) -> tuple[str, ...]:
+    glyphs = FontLoader.get_glyphs(symbol, font)
+    rows = [glyphs[ch] for ch in text]
+    if not rows:
+        return ('',) * FontLoader.registry.resolve(font).height
+    return tuple(''.join(parts) for parts in zip(*rows))
+
+
+FontLoader.registry.add_invalidation_listener(FontLoader._invalidate)
 
 
 class Printer:
-    def __init__(self, color: Color = Color.WHITE, position: tuple[int, int] = (1, 1), symbol: str = '*') -> None:
+    def __init__(self, color: Color = Color.WHITE, position: tuple[int, int] = (1, 1), symbol: str = '*',
+                 stream: TextIO | None = None, buffered: bool = False, font: str = DEFAULT_FONT) -> None:
         self._color = color
         self._symbol = symbol
+        self._font = font
         self._fonts = None
+        self._stream = stream
+        self._buffer = io.StringIO() if buffered else None
         self._base_position_x = position[0]
         self._base_position_y = position[1]
         self._position_x = self._base_position_x
         self._position_y = self._base_position_y
 
-    @classmethod
-    def print_static(cls, text: str, color=Color.WHITE, position: tuple[int, int] = (1, 1), symbol: str = '*') -> None:
-        pos_x, pos_y = position
-        sys.stdout.write(f"\033[{pos_y};{pos_x}H")
-        sys.stdout.write(color.value)
-        text = text.upper()
-        fonts = FontLoader.get_fonts()
-        height = len(next(iter(fonts.values())))
-        for row in range(height):
-            for ch in text:
-                line = fonts[ch][row]
-                for bit in line:
-                    sys.stdout.write(symbol if bit == '1' else ' ')
+    @staticmethod
+    def _render(out: list[str], text: str, color: Color, pos_x: int, pos_y: int, symbol: str,
+                font: str = DEFAULT_FONT) -> int:
+        out.append(f"\033[{pos_y};{pos_x}H")
+        out.append(color.value)
+        for line in FontLoader.render_lines(text.upper(), symbol, font):
             pos_y += 1
-            sys.stdout.write(f"\033[{pos_y};{pos_x}H")
-        sys.stdout.write(Color.RESET.value)
+            out.append(line)
+            out.append(f"\033[{pos_y};{pos_x}H")
+        return pos_y
+
+    @classmethod
+    def render_to_string(cls, text: str, color=Color.WHITE, position: tuple[int, int] = (1, 1), symbol: str = '*',
+                         font: str = DEFAULT_FONT) -> str:
+        out = []
+        cls._render(out, text, color, position[0], position[1], symbol, font)
+        out.append(Color.RESET.value)
+        return ''.join(out)
+
+    @classmethod
+    def print_static(cls, text: str, color=Color.WHITE, position: tuple[int, int] = (1, 1), symbol: str = '*',
+                     stream: TextIO | None = None, font: str = DEFAULT_FONT) -> None:
+        (stream or sys.stdout).write(cls.render_to_string(text, color, position, symbol, font))
 
     def print_dynamic(self, text: str) -> None:
         if self._fonts is None:
             raise RuntimeError("Шрифты не загружены. Используй Printer в блоке 'with'.")
-        sys.stdout.write(f"\033[{self._position_y};{self._position_x}H")
-        sys.stdout.write(self._color.value)
-        text = text.upper()
-        height = len(next(iter(self._fonts.values())))
-        for row in range(height):
-            for char in text:
-                line = self._fonts[char][row]
-                for symbol in line:
-                    sys.stdout.write(self._symbol if symbol == '1' else ' ')
-            self._position_y += 1
-            sys.stdout.write(f"\033[{self._position_y};{self._position_x}H")
-        self._position_y += 1
+        out = []
+        self._position_y = self._render(out, text, self._color, self._position_x,
+                                        self._position_y, self._symbol, self._font) + 1
+        self._write(''.join(out))
+
+    def _write(self, data: str) -> None:
+        if self._buffer is not None:
+            self._buffer.write(data)
+        else:
+            (self._stream or sys.stdout).write(data)
+
+    def flush(self) -> None:
+        stream = self._stream or sys.stdout
+        if self._buffer is not None and self._buffer.tell():
+            stream.write(self._buffer.getvalue())
+            self._buffer.seek(0)
+            self._buffer.truncate()
+        stream.flush()
 
     def __enter__(self) -> "Printer":
-        self._fonts = FontLoader.get_fonts()
+        self._fonts = FontLoader.get_fonts(self._font)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
-        sys.stdout.write(Color.RESET.value)
-        sys.stdout.write("\033[1;1H")
+        self._write(Color.RESET.value + "\033[1;1H")
+        self.flush()
         return False
 
 
@@ -0,0 +1,76 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import Iterable, Iterator
+import multiprocessing, os
+
+try:
+    from .Lab2 import Color, FontLoader, Printer, DEFAULT_FONT
+except ImportError:
+    from Lab2 import Color, FontLoader, Printer, DEFAULT_FONT
+
+
+@dataclass(frozen=True)
+class BannerJob:
+    text: str
+    color: Color = Color.WHITE
+    symbol: str = '*'
+    position: tuple[int, int] = (1, 1)
+    font: str = DEFAULT_FONT
+
+
+def _render_chunk(jobs: list[BannerJob]) -> list[str]:
+    return [Printer.render_to_string(job.text, job.color, job.position, job.symbol, job.font)
+            for job in jobs]
+
+
+def _init_worker(registrations: dict[str, tuple[str, tuple[str, ...]]]) -> None:
+    for name, (file_path, fallbacks) in registrations.items():
+        FontLoader.register_font(name, file_path, fallbacks)
+
+
+def _make_pool(workers: int) -> ProcessPoolExecutor:
+    if 'fork' in multiprocessing.get_all_start_methods():
+        # дочерние процессы наследуют уже загруженные шрифты,
+        # а страницы mmap бинарного шрифта остаются общими
+        return ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('fork'))
+    return ProcessPoolExecutor(workers, initializer=_init_worker,
+                               initargs=(FontLoader.registry.registered(),))
+
+
+def iter_render(jobs: Iterable[BannerJob], workers: int | None = None,
+                chunksize: int = 64) -> Iterator[str]:
+    if chunksize <= 0:
+        raise ValueError("chunksize должен быть положительным")
+    workers = workers or os.cpu_count() or 1
+    jobs = iter(jobs)
+    chunks = iter(lambda: list(islice(jobs, chunksize)), [])
+    if workers == 1:
+        for chunk in chunks:
+            yield from _render_chunk(chunk)
+        return
+
+    first = next(chunks, None)
+    if first is None:
+        return
+    for font in {job.font for job in first}:
+        FontLoader.get_fonts(font)
+
+    with _make_pool(workers) as pool:
+        # в работе держится ограниченное число пакетов, чтобы поток заданий
+        # любой длины не накапливался в памяти целиком
+        pending = deque([pool.submit(_render_chunk, first)])
+        for chunk in islice(chunks, workers * 2 - 1):
+            pending.append(pool.submit(_render_chunk, chunk))
+        while pending:
+            banners = pending.popleft().result()
+            chunk = next(chunks, None)
+            if chunk is not None:
+                pending.append(pool.submit(_render_chunk, chunk))
+            yield from banners
+
+
+def render_many(jobs: Iterable[BannerJob], workers: int | None = None,
+                chunksize: int = 64) -> list[str]:
+    return list(iter_render(jobs, workers, chunksize))
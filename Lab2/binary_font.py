@@ -0,0 +1,135 @@
+from collections.abc import Mapping
+from typing import Iterator
+import json, mmap, os, struct, sys
+
+# Формат файла (все числа little-endian):
+#   заголовок: magic b'BFNT', версия u8, зарезервировано u8, высота u16, число глифов u32
+#   таблица глифов, отсортированная по коду символа: код u32, ширина u16, смещение u32
+#   битовые карты: для каждой строки глифа ceil(ширина / 8) байт, старший бит слева
+MAGIC = b'BFNT'
+VERSION = 1
+_HEADER = struct.Struct('<4sBBHI')
+_ENTRY = struct.Struct('<IHI')
+
+
+def _row_bytes(width: int) -> int:
+    return (width + 7) // 8
+
+
+def convert_json_to_binary(json_path: str, binary_path: str) -> None:
+    try:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            fonts = json.load(f)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Ошибка при разборе JSON из файла '{json_path}': {e}")
+
+    height = len(next(iter(fonts.values()))) if fonts else 0
+    glyphs = sorted(fonts.items(), key=lambda item: ord(item[0]))
+    table = bytearray()
+    bitmaps = bytearray()
+    data_start = _HEADER.size + _ENTRY.size * len(glyphs)
+    for ch, rows in glyphs:
+        if len(ch) != 1:
+            raise ValueError(f"Ключ '{ch}' должен быть одним символом")
+        if len(rows) != height:
+            raise ValueError(f"Глиф '{ch}' имеет высоту {len(rows)}, ожидается {height}")
+        width = len(rows[0]) if rows else 0
+        table += _ENTRY.pack(ord(ch), width, data_start + len(bitmaps))
+        for row in rows:
+            if len(row) != width or set(row) - {'0', '1'}:
+                raise ValueError(f"Некорректная строка '{row}' в глифе '{ch}'")
+            bits = int(row, 2) << (_row_bytes(width) * 8 - width) if width else 0
+            bitmaps += bits.to_bytes(_row_bytes(width), 'big')
+
+    with open(binary_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, height, len(glyphs)))
+        f.write(table)
+        f.write(bitmaps)
+
+
+class BinaryFont(Mapping):
+    def __init__(self, file_path: str) -> None:
+        self._file_path = file_path
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < _HEADER.size:
+                raise ValueError(f"Файл '{file_path}' не является бинарным шрифтом")
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, self._height, self._count = _HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Файл '{file_path}' не является бинарным шрифтом")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"Неподдерживаемая версия шрифта {version} в файле '{file_path}'")
+        self._decoded: dict[str, list[str]] = {}
+        self._decoded_size = 0
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @property
+    def memory_size(self) -> int:
+        # отображение файла учитывается целиком как верхняя граница резидентной памяти
+        return len(self._data) + self._decoded_size
+
+    def _entry(self, index: int) -> tuple[int, int, int]:
+        return _ENTRY.unpack_from(self._data, _HEADER.size + index * _ENTRY.size)
+
+    def _find(self, code: int) -> tuple[int, int] | None:
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            mid_code, width, offset = self._entry(mid)
+            if mid_code < code:
+                lo = mid + 1
+            elif mid_code > code:
+                hi = mid
+            else:
+                return width, offset
+        return None
+
+    def _decode(self, width: int, offset: int) -> list[str]:
+        size = _row_bytes(width)
+        shift = size * 8 - width
+        rows = []
+        for row in range(self._height):
+            start = offset + row * size
+            bits = int.from_bytes(self._data[start:start + size], 'big') >> shift
+            rows.append(format(bits, f'0{width}b') if width else '')
+        return rows
+
+    def __getitem__(self, ch: str) -> list[str]:
+        glyph = self._decoded.get(ch)
+        if glyph is None:
+            found = self._find(ord(ch)) if isinstance(ch, str) and len(ch) == 1 else None
+            if found is None:
+                raise KeyError(ch)
+            glyph = self._decoded[ch] = self._decode(*found)
+            self._decoded_size += sys.getsizeof(glyph) + sum(map(sys.getsizeof, glyph))
+        return glyph
+
+    def __contains__(self, ch) -> bool:
+        if ch in self._decoded:
+            return True
+        return isinstance(ch, str) and len(ch) == 1 and self._find(ord(ch)) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._count):
+            yield chr(self._entry(index)[0])
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        self._data.close()
+
+    def __repr__(self):
+        return f"BinaryFont('{self._file_path}', {self._count} glyphs)"
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Использование: python -m Lab2.binary_font <шрифт.json> <шрифт.bfnt>")
+        sys.exit(1)
+    convert_json_to_binary(sys.argv[1], sys.argv[2])
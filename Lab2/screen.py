@@ -0,0 +1,123 @@
+from typing import TextIO
+import sys
+
+try:
+    from .Lab2 import Color, FontLoader, DEFAULT_FONT
+except ImportError:
+    from Lab2 import Color, FontLoader, DEFAULT_FONT
+
+
+class Screen:
+    # Сколько неизменившихся клеток выгоднее перерисовать, чем переставить курсор:
+    # перемещение "\033[y;xH" занимает не меньше 6 байт.
+    GAP_LIMIT = 4
+
+    def __init__(self, width: int, height: int, stream: TextIO | None = None) -> None:
+        if width <= 0 or height <= 0:
+            raise ValueError("Размеры экрана должны быть положительными")
+        self._width = width
+        self._height = height
+        self._stream = stream
+        size = width * height
+        self._chars = [' '] * size
+        self._colors: list[Color | None] = [None] * size
+        self._front_chars = [' '] * size
+        self._front_colors: list[Color | None] = [None] * size
+        self._needs_clear = True
+        self.bytes_written = 0
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    def clear(self) -> None:
+        size = self._width * self._height
+        self._chars = [' '] * size
+        self._colors = [None] * size
+
+    def invalidate(self) -> None:
+        size = self._width * self._height
+        self._front_chars = [' '] * size
+        self._front_colors = [None] * size
+        self._needs_clear = True
+
+    def put(self, x: int, y: int, ch: str, color: Color | None = None) -> None:
+        if 1 <= x <= self._width and 1 <= y <= self._height:
+            index = (y - 1) * self._width + x - 1
+            self._chars[index] = ch
+            # у пробела нет видимого цвета, поэтому он не должен провоцировать смену цвета
+            self._colors[index] = None if ch == ' ' else color
+
+    def draw_text(self, text: str, position: tuple[int, int] = (1, 1), color: Color = Color.WHITE,
+                  symbol: str = '*', font: str = DEFAULT_FONT) -> int:
+        pos_x, pos_y = position
+        lines = FontLoader.render_lines(text.upper(), symbol, font)
+        for row, line in enumerate(lines):
+            for column, ch in enumerate(line):
+                self.put(pos_x + column, pos_y + row, ch, color)
+        return pos_y + len(lines)
+
+    def render(self) -> str:
+        out = []
+        if self._needs_clear:
+            out.append("\033[2J")
+            self._needs_clear = False
+        width = self._width
+        chars, colors = self._chars, self._colors
+        front_chars, front_colors = self._front_chars, self._front_colors
+        active = None
+        cursor = -1
+        for row in range(self._height):
+            base = row * width
+            end = base + width
+            if chars[base:end] == front_chars[base:end] and colors[base:end] == front_colors[base:end]:
+                continue
+            column = 0
+            while column < width:
+                index = base + column
+                if chars[index] == front_chars[index] and colors[index] == front_colors[index]:
+                    column += 1
+                    continue
+                if index != cursor:
+                    gap = index - cursor
+                    if (0 < gap <= self.GAP_LIMIT and cursor // width == row
+                            and self._can_bridge(cursor, index, active)):
+                        out.append(''.join(chars[cursor:index]))
+                    else:
+                        out.append(f"\033[{row + 1};{column + 1}H")
+                color = colors[index]
+                if color is not active:
+                    if color is not None:
+                        out.append(color.value)
+                        active = color
+                    elif chars[index] != ' ':
+                        # символ цвета по умолчанию нельзя печатать чужим активным цветом
+                        out.append(Color.RESET.value)
+                        active = None
+                out.append(chars[index])
+                front_chars[index] = chars[index]
+                front_colors[index] = color
+                column += 1
+                # после записи в последний столбец позиция курсора зависит от терминала
+                cursor = index + 1 if column < width else -1
+        if active is not None:
+            out.append(Color.RESET.value)
+        return ''.join(out)
+
+    def _can_bridge(self, start: int, end: int, active: Color | None) -> bool:
+        chars, colors = self._chars, self._colors
+        return all(colors[i] is active or (colors[i] is None and chars[i] == ' ') for i in range(start, end))
+
+    def present(self) -> int:
+        data = self.render()
+        if data:
+            stream = self._stream or sys.stdout
+            stream.write(data)
+            stream.flush()
+        written = len(data.encode('utf-8'))
+        self.bytes_written += written
+        return written
@@ -1,5 +1,43 @@
 from abc import ABC, abstractmethod
-import os, re
+from collections import deque
+from datetime import datetime, timezone
+from enum import Enum, IntEnum
+import errno, os, re, socket, sys, threading, time, weakref
+
+
+class LogLevel(IntEnum):
+    NOTSET = 0
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    ERROR = 40
+    CRITICAL = 50
+
+
+class LogRecord:
+    __slots__ = ('level', 'timestamp', 'template', 'args', 'extra', '_message')
+
+    def __init__(self, template: str, args: tuple = (), level: LogLevel = LogLevel.INFO,
+                 extra: dict | None = None) -> None:
+        self.level = level
+        self.timestamp = time.time()
+        self.template = template
+        self.args = args
+        self.extra = extra or {}
+        self._message = None
+
+    @property
+    def message(self) -> str:
+        # строка собирается только тогда, когда она действительно понадобилась
+        if self._message is None:
+            self._message = self.template % self.args if self.args else self.template
+        return self._message
+
+    def __str__(self):
+        return self.message
+
+    def __repr__(self):
+        return f"LogRecord({self.template!r}, {self.args!r}, {self.level.name})"
 
 
 class ILogHandler(ABC):
@@ -7,38 +45,365 @@ class ILogHandler(ABC):
     def handle(self, text: str) -> None:
         pass
 
+    def handle_record(self, record: LogRecord) -> None:
+        self.handle(record.message)
+
+    @property
+    def needs_record(self) -> bool:
+        return type(self).handle_record is not ILogHandler.handle_record
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
 class ConsoleLogHandler(ILogHandler):
     def handle(self, text: str) -> None:
         print(text)
 
+class Durability(Enum):
+    NONE = 'none'
+    FLUSH = 'flush'
+    FSYNC = 'fsync'
+
+
+def _write_lines(file, lines: list[str], durability: Durability) -> None:
+    if lines:
+        file.write(''.join(lines))
+        lines.clear()
+    if durability is not Durability.NONE:
+        file.flush()
+    if durability is Durability.FSYNC:
+        os.fsync(file.fileno())
+
+
+def _flush_later(handler_ref: weakref.ref) -> None:
+    handler = handler_ref()
+    if handler is not None:
+        handler.flush()
+
+
+def _close_file(file, lines: list[str], durability: Durability) -> None:
+    try:
+        _write_lines(file, lines, durability)
+    finally:
+        file.close()
+
+
 class FileLogHandler(ILogHandler):
-    def __init__(self, file_path: str) -> None:
+    def __init__(self, file_path: str, buffered: bool = False, buffer_size: int = 64 * 1024,
+                 flush_interval: float = 1.0, durability: Durability = Durability.FLUSH) -> None:
         self._file_path = file_path
         base_dir = os.path.dirname(__file__)
         self._file_path = os.path.join(base_dir, self._file_path)
+        self._buffered = buffered
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+        self._durability = durability
+        self._file = None
+        self._finalizer = None
+        self._lines: list[str] = []
+        self._size = 0
+        self._last_flush = time.monotonic()
+        self._timer = None
+        self._lock = threading.Lock()
 
-    def handle(self, text: str) -> None:
+    def _open(self) -> None:
         try:
-            with open(self._file_path, 'a', encoding='utf-8') as f:
-                f.write(text + '\n')
+            self._file = open(self._file_path, 'a', encoding='utf-8')
         except PermissionError:
             raise PermissionError(f"Нет доступа к файлу {self._file_path}")
         except OSError as error:
             raise OSError(f"Ошибка {error} при открытии файла {self._file_path}")
+        self._lines = []
+        # строки из буфера дописываются, даже если close() так и не был вызван
+        self._finalizer = weakref.finalize(self, _close_file, self._file, self._lines, self._durability)
 
-class SocketHandler(ILogHandler):
     def handle(self, text: str) -> None:
-        print('Запись в сокет')
+        if not self._buffered:
+            try:
+                with open(self._file_path, 'a', encoding='utf-8') as f:
+                    f.write(text + '\n')
+            except PermissionError:
+                raise PermissionError(f"Нет доступа к файлу {self._file_path}")
+            except OSError as error:
+                raise OSError(f"Ошибка {error} при открытии файла {self._file_path}")
+            return None
+
+        with self._lock:
+            if self._file is None:
+                self._open()
+            self._lines.append(text + '\n')
+            self._size += len(text) + 1
+            if (self._size >= self._buffer_size
+                    or time.monotonic() - self._last_flush >= self._flush_interval):
+                self._flush_locked()
+            elif self._timer is None:
+                # без таймера строки после затишья лежали бы в памяти до следующей записи;
+                # таймер держит слабую ссылку, чтобы не мешать финализатору
+                self._timer = threading.Timer(self._flush_interval, _flush_later, (weakref.ref(self),))
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _flush_locked(self) -> None:
+        self._cancel_timer()
+        if self._file is not None:
+            try:
+                _write_lines(self._file, self._lines, self._durability)
+            except OSError as error:
+                raise OSError(f"Ошибка {error} при записи в файл {self._file_path}")
+        self._size = 0
+        self._last_flush = time.monotonic()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            self._cancel_timer()
+            if self._finalizer is not None:
+                self._finalizer()
+            self._file = None
+            self._finalizer = None
+            self._size = 0
+
+    def __enter__(self) -> "FileLogHandler":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
+        return False
+
+class Transport(Enum):
+    TCP = 'tcp'
+    UDP = 'udp'
+    UNIX = 'unix'
+    UNIX_DGRAM = 'unix_dgram'
+
+
+_TRANSIENT_ERRNOS = {errno.ENETDOWN, errno.ENETUNREACH, errno.EHOSTUNREACH, errno.ENOTCONN,
+                     errno.ECONNABORTED, errno.EPIPE}
+
+
+def _is_transient(error: OSError) -> bool:
+    return (isinstance(error, (ConnectionError, TimeoutError, FileNotFoundError, socket.gaierror))
+            or error.errno in _TRANSIENT_ERRNOS)
+
+
+class SocketHandler(ILogHandler):
+    def __init__(self, address: tuple[str, int] | str = ('localhost', 9020),
+                 transport: Transport = Transport.TCP, backlog: int = 10000, batch_size: int = 256,
+                 max_datagram: int = 8192, timeout: float = 5.0,
+                 backoff_initial: float = 0.1, backoff_max: float = 30.0) -> None:
+        if backlog <= 0 or batch_size <= 0:
+            raise ValueError("backlog и batch_size должны быть положительными")
+        self._address = address
+        self._transport = transport
+        self._capacity = backlog
+        self._batch_size = batch_size
+        self._max_datagram = max_datagram
+        self._timeout = timeout
+        self._backoff_initial = backoff_initial
+        self._backoff_max = backoff_max
+        self._sock = None
+        self._backlog: deque[bytes] = deque()
+        self._in_flight = 0
+        self._cond = threading.Condition()
+        self._closed = False
+        self.sent = 0
+        self.dropped = 0
+        self.reconnects = 0
+        self.errors = 0
+        self._thread = threading.Thread(target=self._run, name=type(self).__name__, daemon=True)
+        self._thread.start()
+
+    def _format(self, text: str) -> bytes:
+        return (text + '\n').encode('utf-8')
 
-class SyslogHandler(ILogHandler):
     def handle(self, text: str) -> None:
-        print('Запись в системные логи')
+        self._enqueue(self._format(text))
+
+    def _enqueue(self, record: bytes) -> None:
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Обработчик закрыт")
+            # запись больше датаграммы не уйдёт никогда, а при повторах заблокировала бы очередь
+            if self._transport in (Transport.UDP, Transport.UNIX_DGRAM) and len(record) > self._max_datagram:
+                self.dropped += 1
+                return
+            if len(self._backlog) >= self._capacity:
+                self._backlog.popleft()
+                self.dropped += 1
+            self._backlog.append(record)
+            if len(self._backlog) == 1:
+                self._cond.notify_all()
+
+    def _connect(self) -> socket.socket:
+        if self._transport is Transport.TCP:
+            sock = socket.create_connection(self._address, self._timeout)
+        else:
+            family = socket.AF_INET if self._transport is Transport.UDP else socket.AF_UNIX
+            kind = socket.SOCK_STREAM if self._transport is Transport.UNIX else socket.SOCK_DGRAM
+            sock = socket.socket(family, kind)
+            sock.settimeout(self._timeout)
+            try:
+                sock.connect(self._address)
+            except OSError:
+                sock.close()
+                raise
+        return sock
+
+    def _datagrams(self, batch: list[bytes]):
+        chunk: list[bytes] = []
+        size = 0
+        for record in batch:
+            if chunk and size + len(record) > self._max_datagram:
+                yield b''.join(chunk)
+                chunk, size = [], 0
+            chunk.append(record)
+            size += len(record)
+        if chunk:
+            yield b''.join(chunk)
+
+    def _send(self, batch: list[bytes]) -> None:
+        if self._sock is None:
+            self._sock = self._connect()
+        if self._transport in (Transport.TCP, Transport.UNIX):
+            self._sock.sendall(b''.join(batch))
+        else:
+            for datagram in self._datagrams(batch):
+                self._sock.send(datagram)
+
+    def _disconnect(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def _run(self) -> None:
+        backoff = self._backoff_initial
+        while True:
+            with self._cond:
+                while not self._backlog and not self._closed:
+                    self._cond.wait()
+                if not self._backlog:
+                    self._disconnect()
+                    return
+                count = min(self._batch_size, len(self._backlog))
+                batch = [self._backlog.popleft() for _ in range(count)]
+                self._in_flight = count
+            try:
+                self._send(batch)
+            except OSError as error:
+                if not _is_transient(error):
+                    # ошибка относится к самим данным, а не к соединению: повтор ничего не изменит
+                    with self._cond:
+                        self._in_flight = 0
+                        self.dropped += len(batch)
+                        self.errors += 1
+                        self._cond.notify_all()
+                    continue
+                self._disconnect()
+                with self._cond:
+                    self._in_flight = 0
+                    if self._closed:
+                        self.dropped += len(batch) + len(self._backlog)
+                        self._backlog.clear()
+                        self._cond.notify_all()
+                        return
+                    # неотправленный пакет возвращается в начало очереди,
+                    # лишние старые записи отбрасываются по общему правилу
+                    self._backlog.extendleft(reversed(batch))
+                    while len(self._backlog) > self._capacity:
+                        self._backlog.popleft()
+                        self.dropped += 1
+                    self.reconnects += 1
+                    self._cond.wait(backoff)
+                backoff = min(backoff * 2, self._backoff_max)
+                continue
+            backoff = self._backoff_initial
+            with self._cond:
+                self._in_flight = 0
+                self.sent += len(batch)
+                self._cond.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._backlog and not self._in_flight,
+                                       self._timeout if timeout is None else timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(self._timeout if timeout is None else timeout)
+
+    def __enter__(self) -> "SocketHandler":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
+        return False
+
+
+class SyslogHandler(SocketHandler):
+    FACILITY_USER = 1
+    SEVERITY_INFO = 6
+    # уровни LogLevel в коды важности syslog (RFC 5424, раздел 6.2.1)
+    _SEVERITIES = {LogLevel.DEBUG: 7, LogLevel.INFO: 6, LogLevel.WARNING: 4,
+                   LogLevel.ERROR: 3, LogLevel.CRITICAL: 2}
+
+    def __init__(self, address: str = '/dev/log', app_name: str | None = None,
+                 facility: int = FACILITY_USER, severity: int = SEVERITY_INFO, **kwargs) -> None:
+        self._facility = facility
+        self._severity = severity
+        self._hostname = socket.gethostname() or '-'
+        self._app_name = (app_name or os.path.basename(sys.argv[0]) or '-')[:48]
+        self._procid = str(os.getpid())
+        super().__init__(address, Transport.UNIX_DGRAM, **kwargs)
+
+    def _format(self, text: str, severity: int | None = None) -> bytes:
+        # RFC 5424: <PRI>VERSION TIMESTAMP HOSTNAME APP-NAME PROCID MSGID STRUCTURED-DATA MSG
+        priority = self._facility * 8 + (self._severity if severity is None else severity)
+        timestamp = datetime.now(timezone.utc).isoformat(timespec='microseconds').replace('+00:00', 'Z')
+        header = f"<{priority}>1 {timestamp} {self._hostname} {self._app_name} {self._procid} - -"
+        return f"{header} {text}".encode('utf-8')
+
+    def handle_record(self, record: LogRecord) -> None:
+        severity = self._SEVERITIES.get(record.level, self._severity)
+        self._enqueue(self._format(record.message, severity))
+
+    def _datagrams(self, batch: list[bytes]):
+        return iter(batch)
 
 class ILogFilter(ABC):
     @abstractmethod
     def match(self, text: str) -> bool:
         pass
 
+    def match_record(self, record: LogRecord) -> bool:
+        return self.match(record.message)
+
+    @property
+    def needs_record(self) -> bool:
+        return type(self).match_record is not ILogFilter.match_record
+
+class LevelLogFilter(ILogFilter):
+    def __init__(self, level: LogLevel) -> None:
+        self._level = level
+
+    def match(self, text: str) -> bool:
+        return True
+
+    def match_record(self, record: LogRecord) -> bool:
+        return record.level >= self._level
+
 class SimpleLogFilter(ILogFilter):
     def __init__(self, pattern: str) -> None:
         self._pattern = pattern
@@ -49,22 +414,78 @@ class SimpleLogFilter(ILogFilter):
 class ReLogFilter(ILogFilter):
     def __init__(self, pattern: str) -> None:
         self._pattern = pattern
+        self._regex = re.compile(pattern)
 
     def match(self, text: str) -> bool:
-        return bool(re.search(self._pattern, text))
+        return self._regex.search(text) is not None
 
 class Logger:
     def __init__(self, handlers: list[ILogHandler],
-                 filters: list[ILogFilter]) -> None:
+                 filters: list[ILogFilter], level: LogLevel = LogLevel.NOTSET) -> None:
         self._handlers = handlers
         self._filters = filters
+        self._level = level
+
+    @property
+    def level(self) -> LogLevel:
+        return self._level
+
+    @level.setter
+    def level(self, value: LogLevel) -> None:
+        self._level = LogLevel(value)
 
-    def log(self, text: str) -> None:
-        if not all(log_filter.match(text) for log_filter in self._filters):
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        return level >= self._level
+
+    def _is_plain(self) -> bool:
+        # строку можно отдать обработчикам напрямую, только если ни фильтры, ни обработчики не смотрят на уровень;
+        # списки принадлежат вызывающему коду и могут меняться, поэтому проверка выполняется при каждом вызове
+        return (not any(f.needs_record for f in self._filters)
+                and not any(h.needs_record for h in self._handlers))
+
+    def log(self, text: str | LogRecord, *args, level: LogLevel = LogLevel.INFO,
+            extra: dict | None = None) -> None:
+        if isinstance(text, LogRecord):
+            if text.level < self._level:
+                return None
+            return self._dispatch(text)
+        if level < self._level:
             return None
+        if not args and extra is None and level == LogLevel.INFO and self._is_plain():
+            if not all(log_filter.match(text) for log_filter in self._filters):
+                return None
+
+            for handler in self._handlers:
+                handler.handle(text)
+            return None
+        return self._dispatch(LogRecord(text, args, level, extra))
+
+    def _dispatch(self, record: LogRecord) -> None:
+        if not all(log_filter.match_record(record) for log_filter in self._filters):
+            return None
+
+        for handler in self._handlers:
+            handler.handle_record(record)
+
+    def debug(self, template: str, *args, **extra) -> None:
+        self.log(template, *args, level=LogLevel.DEBUG, extra=extra)
+
+    def info(self, template: str, *args, **extra) -> None:
+        self.log(template, *args, level=LogLevel.INFO, extra=extra)
+
+    def warning(self, template: str, *args, **extra) -> None:
+        self.log(template, *args, level=LogLevel.WARNING, extra=extra)
+
+    def error(self, template: str, *args, **extra) -> None:
+        self.log(template, *args, level=LogLevel.ERROR, extra=extra)
+
+    def flush(self) -> None:
+        for handler in self._handlers:
+            handler.flush()
 
+    def close(self) -> None:
         for handler in self._handlers:
-            handler.handle(text)
+            handler.close()
 
 if __name__ == "__main__":
     file_handler = FileLogHandler('myfile.txt')
@@ -0,0 +1,123 @@
+from collections import deque
+from enum import Enum
+import threading
+
+try:
+    from .Lab3 import Logger, ILogHandler, ILogFilter, LogLevel, LogRecord
+except ImportError:
+    from Lab3 import Logger, ILogHandler, ILogFilter, LogLevel, LogRecord
+
+
+class OverflowPolicy(Enum):
+    BLOCK = 'block'
+    DROP_OLDEST = 'drop_oldest'
+    DROP_NEWEST = 'drop_newest'
+
+
+class AsyncLogger(Logger):
+    def __init__(self, handlers: list[ILogHandler], filters: list[ILogFilter],
+                 capacity: int = 1024, overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+                 level: LogLevel = LogLevel.NOTSET) -> None:
+        super().__init__(handlers, filters, level)
+        if not isinstance(capacity, int) or capacity <= 0:
+            raise ValueError("Ёмкость очереди должна быть положительным целым числом")
+        if not isinstance(overflow, OverflowPolicy):
+            raise TypeError("overflow должен быть значением OverflowPolicy")
+        self._capacity = capacity
+        self._overflow = overflow
+        self._queue: deque[str | LogRecord] = deque()
+        self._cond = threading.Condition()
+        self._pending = 0
+        self._closed = False
+        self._dropped = 0
+        self._errors = 0
+        self._processed = 0
+        self._thread = threading.Thread(target=self._run, name='AsyncLogger', daemon=True)
+        self._thread.start()
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    @property
+    def errors(self) -> int:
+        return self._errors
+
+    @property
+    def processed(self) -> int:
+        return self._processed
+
+    def log(self, text: str | LogRecord, *args, level: LogLevel = LogLevel.INFO,
+            extra: dict | None = None) -> None:
+        # уровень проверяется в вызывающем потоке, а форматирование
+        # сообщения откладывается до фонового потока
+        if isinstance(text, LogRecord):
+            if text.level < self._level:
+                return None
+        elif level < self._level:
+            return None
+        elif args or extra is not None or level != LogLevel.INFO or not self._is_plain():
+            text = LogRecord(text, args, level, extra)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Логгер закрыт")
+            if len(self._queue) >= self._capacity:
+                if self._overflow is OverflowPolicy.DROP_NEWEST:
+                    self._dropped += 1
+                    return None
+                if self._overflow is OverflowPolicy.DROP_OLDEST:
+                    self._queue.popleft()
+                    self._pending -= 1
+                    self._dropped += 1
+                else:
+                    while len(self._queue) >= self._capacity and not self._closed:
+                        self._cond.wait()
+                    if self._closed:
+                        raise RuntimeError("Логгер закрыт")
+            was_empty = not self._queue
+            self._queue.append(text)
+            self._pending += 1
+            if was_empty:
+                self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                batch = list(self._queue)
+                self._queue.clear()
+                self._cond.notify_all()
+            errors = 0
+            for text in batch:
+                try:
+                    Logger.log(self, text)
+                except Exception:
+                    errors += 1
+            with self._cond:
+                self._pending -= len(batch)
+                self._processed += len(batch) - errors
+                self._errors += errors
+                self._cond.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        with self._cond:
+            drained = self._cond.wait_for(lambda: self._pending == 0, timeout)
+        super().flush()
+        return drained
+
+    def close(self, timeout: float | None = None) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        super().close()
+
+    def __enter__(self) -> "AsyncLogger":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
+        return False
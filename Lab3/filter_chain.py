@@ -0,0 +1,152 @@
+from dataclasses import dataclass
+from time import perf_counter_ns
+from typing import Callable
+import re
+
+try:
+    from .Lab3 import ILogFilter, LogRecord, SimpleLogFilter, ReLogFilter
+except ImportError:
+    from Lab3 import ILogFilter, LogRecord, SimpleLogFilter, ReLogFilter
+
+
+@dataclass
+class FilterStats:
+    name: str
+    calls: int = 0
+    passed: int = 0
+    sampled: int = 0
+    time_ns: int = 0
+
+    @property
+    def pass_rate(self) -> float:
+        return self.passed / self.calls if self.calls else 1.0
+
+    @property
+    def avg_ns(self) -> float:
+        return self.time_ns / self.sampled if self.sampled else 0.0
+
+
+class _CompiledFilter:
+    __slots__ = ('check', 'check_record', 'on_record', 'stats')
+
+    def __init__(self, check: Callable[[str], object], name: str,
+                 check_record: Callable[[LogRecord], object] | None = None) -> None:
+        self.check = check
+        self.check_record = check_record or (lambda record: check(record.message))
+        self.on_record = check_record is not None
+        self.stats = FilterStats(name)
+
+
+def _substring_check(pattern: str) -> Callable[[str], bool]:
+    return lambda text: pattern in text
+
+
+def compile_filters(filters: list[ILogFilter]) -> list[_CompiledFilter]:
+    substrings: list[str] = []
+    compiled: list[_CompiledFilter] = []
+    for log_filter in filters:
+        if type(log_filter) is SimpleLogFilter:
+            substrings.append(log_filter._pattern)
+        elif type(log_filter) is ReLogFilter:
+            pattern = log_filter._pattern
+            if re.escape(pattern) == pattern:
+                substrings.append(pattern)
+            else:
+                compiled.append(_CompiledFilter(log_filter._regex.search, f"re:{pattern}"))
+        elif log_filter.needs_record:
+            compiled.append(_CompiledFilter(log_filter.match, type(log_filter).__name__,
+                                            log_filter.match_record))
+        else:
+            compiled.append(_CompiledFilter(log_filter.match, type(log_filter).__name__))
+
+    # все фильтры объединяются через "и", поэтому пустая подстрока ничего не отсекает,
+    # а подстрока, входящая в другую обязательную подстроку, проверяется ею же
+    unique = sorted(set(substrings) - {''}, key=len, reverse=True)
+    required: list[str] = []
+    for pattern in unique:
+        if not any(pattern in longer for longer in required):
+            required.append(pattern)
+    return [_CompiledFilter(_substring_check(p), f"in:{p}") for p in required] + compiled
+
+
+def _rank(compiled: _CompiledFilter) -> float:
+    # для цепочки "и" выгоднее всего сначала проверять фильтры
+    # с наименьшим отношением стоимости к вероятности отказа
+    stats = compiled.stats
+    reject = 1.0 - stats.pass_rate
+    return (stats.avg_ns or 1.0) / max(reject, 1e-6)
+
+
+class CompiledFilterChain(ILogFilter):
+    def __init__(self, filters: list[ILogFilter], reorder_every: int = 1024,
+                 sample_every: int = 16) -> None:
+        if reorder_every <= 0 or sample_every <= 0:
+            raise ValueError("reorder_every и sample_every должны быть положительными")
+        compiled = compile_filters(filters)
+        # фильтры, которым хватает полей записи (например, уровня), проверяются раньше текстовых,
+        # чтобы отклонённая ими запись вообще не форматировалась
+        self._record_filters = [c for c in compiled if c.on_record]
+        self._text_filters = [c for c in compiled if not c.on_record]
+        self._reorder_every = reorder_every
+        self._sample_every = sample_every
+        self._calls = 0
+
+    @property
+    def needs_record(self) -> bool:
+        return bool(self._record_filters)
+
+    @property
+    def stats(self) -> list[FilterStats]:
+        return [compiled.stats for compiled in self._record_filters + self._text_filters]
+
+    @staticmethod
+    def _sampled(filters: list[_CompiledFilter], check: str, value) -> bool:
+        for compiled in filters:
+            stats = compiled.stats
+            stats.calls += 1
+            start = perf_counter_ns()
+            ok = getattr(compiled, check)(value)
+            stats.time_ns += perf_counter_ns() - start
+            stats.sampled += 1
+            if not ok:
+                return False
+            stats.passed += 1
+        return True
+
+    def _tick(self) -> bool:
+        self._calls += 1
+        if self._calls % self._reorder_every == 0:
+            self.reorder()
+        return self._calls % self._sample_every == 0
+
+    def match(self, text: str) -> bool:
+        # статистика обновляется только на выборочных вызовах, остальные проходят без учёта
+        if self._tick():
+            return (self._sampled(self._record_filters, 'check', text)
+                    and self._sampled(self._text_filters, 'check', text))
+        for compiled in self._record_filters:
+            if not compiled.check(text):
+                return False
+        for compiled in self._text_filters:
+            if not compiled.check(text):
+                return False
+        return True
+
+    def match_record(self, record: LogRecord) -> bool:
+        if self._tick():
+            return (self._sampled(self._record_filters, 'check_record', record)
+                    and self._sampled(self._text_filters, 'check_record', record))
+        for compiled in self._record_filters:
+            if not compiled.check_record(record):
+                return False
+        if not self._text_filters:
+            return True
+        text = record.message
+        for compiled in self._text_filters:
+            if not compiled.check(text):
+                return False
+        return True
+
+    def reorder(self) -> None:
+        self._record_filters.sort(key=_rank)
+        self._text_filters.sort(key=_rank)
@@ -0,0 +1,141 @@
+from queue import Queue
+import gzip, os, shutil, threading, time
+
+try:
+    from .Lab3 import ILogHandler
+except ImportError:
+    from Lab3 import ILogHandler
+
+
+class RotatingFileLogHandler(ILogHandler):
+    def __init__(self, file_path: str, max_bytes: int | None = None, interval: float | None = None,
+                 backup_count: int = 5, compress: bool = True) -> None:
+        if max_bytes is None and interval is None:
+            raise ValueError("Нужно указать max_bytes и/или interval")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes должен быть положительным")
+        if interval is not None and interval <= 0:
+            raise ValueError("interval должен быть положительным")
+        if backup_count < 0:
+            raise ValueError("backup_count не может быть отрицательным")
+        base_dir = os.path.dirname(__file__)
+        self._file_path = os.path.join(base_dir, file_path)
+        self._max_bytes = max_bytes
+        self._interval = interval
+        self._backup_count = backup_count
+        self._compress = compress
+        self._lock = threading.Lock()
+        self._file = None
+        self._size = 0
+        self._rollover_at = None
+        self._sequence = 0
+        self._closed = False
+        self.errors = 0
+        self._jobs: Queue = Queue()
+        self._worker = threading.Thread(target=self._run, name='RotatingFileLogHandler', daemon=True)
+        self._worker.start()
+
+    def _suffix(self) -> str:
+        return '.gz' if self._compress else ''
+
+    def _generation(self, index: int) -> str:
+        return f"{self._file_path}.{index}{self._suffix()}"
+
+    def _open(self) -> None:
+        try:
+            self._file = open(self._file_path, 'a', encoding='utf-8')
+        except PermissionError:
+            raise PermissionError(f"Нет доступа к файлу {self._file_path}")
+        except OSError as error:
+            raise OSError(f"Ошибка {error} при открытии файла {self._file_path}")
+        self._size = self._file.tell()
+        if self._interval is not None:
+            self._rollover_at = time.time() + self._interval
+
+    def handle(self, text: str) -> None:
+        line = text + '\n'
+        size = len(line.encode('utf-8'))
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Обработчик закрыт")
+            if self._file is None:
+                self._open()
+            if self._should_rotate(size):
+                self._rotate()
+            try:
+                self._file.write(line)
+                self._file.flush()
+            except OSError as error:
+                raise OSError(f"Ошибка {error} при записи в файл {self._file_path}")
+            self._size += size
+
+    def _should_rotate(self, size: int) -> bool:
+        if self._max_bytes is not None and self._size and self._size + size > self._max_bytes:
+            return True
+        return self._rollover_at is not None and time.time() >= self._rollover_at
+
+    def _rotate(self) -> None:
+        # в потоке логирования остаётся только переименование;
+        # сдвиг поколений и сжатие выполняет фоновый поток
+        self._file.close()
+        self._sequence += 1
+        rotated = f"{self._file_path}.rotating-{os.getpid()}-{self._sequence}"
+        os.replace(self._file_path, rotated)
+        self._jobs.put(rotated)
+        self._open()
+
+    def _run(self) -> None:
+        while True:
+            rotated = self._jobs.get()
+            try:
+                if rotated is None:
+                    return
+                self._store_generation(rotated)
+            except Exception:
+                # поток должен пережить любую ошибку, иначе flush() будет ждать очередь вечно
+                self.errors += 1
+            finally:
+                self._jobs.task_done()
+
+    def _store_generation(self, rotated: str) -> None:
+        if self._backup_count == 0:
+            os.remove(rotated)
+            return
+        oldest = self._generation(self._backup_count)
+        if os.path.exists(oldest):
+            os.remove(oldest)
+        for index in range(self._backup_count - 1, 0, -1):
+            source = self._generation(index)
+            if os.path.exists(source):
+                os.replace(source, self._generation(index + 1))
+        target = self._generation(1)
+        if self._compress:
+            with open(rotated, 'rb') as src, gzip.open(target + '.tmp', 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            os.replace(target + '.tmp', target)
+            os.remove(rotated)
+        else:
+            os.replace(rotated, target)
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+        self._jobs.join()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        if self._worker.is_alive():
+            self._jobs.put(None)
+            self._worker.join()
+
+    def __enter__(self) -> "RotatingFileLogHandler":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
+        return False
@@ -0,0 +1,148 @@
+from enum import Enum
+from typing import Iterator
+import json, os, struct, threading, weakref
+
+try:
+    from .Lab3 import ILogHandler, LogLevel, LogRecord
+except ImportError:
+    from Lab3 import ILogHandler, LogLevel, LogRecord
+
+
+class RecordFormat(Enum):
+    JSON_LINES = 'jsonl'
+    # запись: длина u32 | время f64 | уровень u8 | длина сообщения u32 | сообщение | extra в JSON
+    LENGTH_PREFIXED = 'binary'
+
+
+_LENGTH = struct.Struct('>I')
+_HEADER = struct.Struct('>dBI')
+
+
+def encode_record(record: LogRecord, record_format: RecordFormat) -> bytes:
+    if record_format is RecordFormat.JSON_LINES:
+        data = {'ts': record.timestamp, 'level': record.level.name, 'msg': record.message}
+        if record.extra:
+            data['extra'] = record.extra
+        return json.dumps(data, ensure_ascii=False, default=str).encode('utf-8') + b'\n'
+    message = record.message.encode('utf-8')
+    extra = json.dumps(record.extra, ensure_ascii=False, default=str).encode('utf-8') if record.extra else b''
+    body = _HEADER.pack(record.timestamp, int(record.level), len(message)) + message + extra
+    return _LENGTH.pack(len(body)) + body
+
+
+class _BatchWriter:
+    def __init__(self, fd: int, capacity: int) -> None:
+        self.fd = fd
+        self.buffer = bytearray(capacity)
+        self.used = 0
+
+    def append(self, data: bytes) -> None:
+        end = self.used + len(data)
+        self.buffer[self.used:end] = data
+        self.used = end
+
+    def flush(self) -> None:
+        # весь пакет уходит одним системным вызовом; цикл нужен только на случай частичной записи
+        done = 0
+        try:
+            with memoryview(self.buffer) as view:
+                while done < self.used:
+                    with view[done:self.used] as rest:
+                        done += os.write(self.fd, rest)
+        finally:
+            # после ошибки в буфере остаётся только неотправленный хвост, иначе следующий flush
+            # повторил бы уже записанные байты и сломал бы поток записей
+            remaining = self.used - done
+            if done and remaining:
+                self.buffer[:remaining] = self.buffer[done:self.used]
+            self.used = remaining
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            os.close(self.fd)
+
+
+class StructuredFileLogHandler(ILogHandler):
+    def __init__(self, file_path: str, record_format: RecordFormat = RecordFormat.JSON_LINES,
+                 batch_bytes: int = 64 * 1024) -> None:
+        if batch_bytes <= 0:
+            raise ValueError("batch_bytes должен быть положительным")
+        base_dir = os.path.dirname(__file__)
+        self._file_path = os.path.join(base_dir, file_path)
+        self._format = record_format
+        self._batch_bytes = batch_bytes
+        self._writer = None
+        self._finalizer = None
+        self._lock = threading.Lock()
+
+    def _open(self) -> None:
+        try:
+            fd = os.open(self._file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        except PermissionError:
+            raise PermissionError(f"Нет доступа к файлу {self._file_path}")
+        except OSError as error:
+            raise OSError(f"Ошибка {error} при открытии файла {self._file_path}")
+        self._writer = _BatchWriter(fd, self._batch_bytes)
+        self._finalizer = weakref.finalize(self, self._writer.close)
+
+    def handle(self, text: str) -> None:
+        self.handle_record(LogRecord(text))
+
+    def handle_record(self, record: LogRecord) -> None:
+        data = encode_record(record, self._format)
+        with self._lock:
+            if self._writer is None:
+                self._open()
+            if self._writer.used and self._writer.used + len(data) > self._batch_bytes:
+                self._writer.flush()
+            self._writer.append(data)
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._writer is not None:
+                self._writer.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._finalizer is not None:
+                self._finalizer()
+            self._writer = None
+            self._finalizer = None
+
+    def __enter__(self) -> "StructuredFileLogHandler":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
+        return False
+
+
+def _make_record(timestamp: float, level: LogLevel, message: str, extra: dict) -> LogRecord:
+    record = LogRecord(message, (), level, extra)
+    record.timestamp = timestamp
+    return record
+
+
+def iter_records(file_path: str, record_format: RecordFormat = RecordFormat.JSON_LINES) -> Iterator[LogRecord]:
+    with open(file_path, 'rb') as f:
+        if record_format is RecordFormat.JSON_LINES:
+            for line in f:
+                if line.strip():
+                    data = json.loads(line)
+                    yield _make_record(data['ts'], LogLevel[data['level']], data['msg'], data.get('extra'))
+            return
+
+        while prefix := f.read(_LENGTH.size):
+            if len(prefix) < _LENGTH.size:
+                raise ValueError(f"Файл '{file_path}' обрывается посреди записи")
+            (length,) = _LENGTH.unpack(prefix)
+            body = f.read(length)
+            if len(body) < length:
+                raise ValueError(f"Файл '{file_path}' обрывается посреди записи")
+            timestamp, level, message_length = _HEADER.unpack_from(body)
+            start = _HEADER.size
+            message = body[start:start + message_length].decode('utf-8')
+            extra = body[start + message_length:]
+            yield _make_record(timestamp, LogLevel(level), message, json.loads(extra) if extra else None)
@@ -1,5 +1,14 @@
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, Callable, Iterable, Iterator
 from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import compress, repeat
+from operator import attrgetter, itemgetter, gt, lt, not_, or_
+from types import MethodType
+import asyncio, inspect, threading, weakref
 
 T = TypeVar('T')
 
@@ -8,6 +17,10 @@ class IPropertyChangedListener(Generic[T], ABC):
     def on_property_changed(self, obj: T, property_name: str) -> None:
         ...
 
+    def on_properties_changed(self, obj: T, property_names: tuple[str, ...]) -> None:
+        for property_name in property_names:
+            self.on_property_changed(obj, property_name)
+
 class IDataChanged(Generic[T], ABC):
     @abstractmethod
     def add_property_changed_listener(self, listener: IPropertyChangedListener[T]) -> None:
@@ -32,84 +45,459 @@ class INotifyDataChanging(Generic[T], ABC):
     def remove_property_changing_listener(self, listener: IPropertyChangingListener[T]) -> None:
         ...
 
-class Product(INotifyDataChanging['Product'], IDataChanged['Product']):
-    def __init__(self, price: float, rate: float, availability: bool) -> None:
-        self._changing_listeners: list[IPropertyChangingListener['Product']] = []
-        self._changed_listeners: list[IPropertyChangedListener['Product']] = []
-        self._price = price
-        self._rate = rate
-        self._availability = availability
+class ObservableProperty:
+    def __init__(self, types: type | tuple[type, ...], error: str) -> None:
+        self._types = types
+        self._error = error
+        self._name = ''
+        self._attr = ''
 
-    @property
-    def price(self) -> float:
-        return self._price
-
-    @price.setter
-    def price(self, value: float) -> None:
-        if not isinstance(value, (int, float)):
-            raise ValueError("Ошибка валидации свойства price: значение должно быть числом")
-        if not self._notify_changing('price', self._price, value):
-            return
-        self._price = value
-        self._notify_changed('price')
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+        self._attr = '_' + name
 
-    @property
-    def rate(self) -> float:
-        return self._rate
-
-    @rate.setter
-    def rate(self, value: float) -> None:
-        if not isinstance(value, (int, float)):
-            raise ValueError("Ошибка валидации свойства rate: значение должно быть числом")
-        if not self._notify_changing('rate', self._rate, value):
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        pending = obj._pending
+        if pending is not None and self._name in pending:
+            return pending[self._name]
+        return getattr(obj, self._attr)
+
+    def __set__(self, obj, value) -> None:
+        if not isinstance(value, self._types):
+            raise ValueError(f"Ошибка валидации свойства {self._name}: {self._error}")
+        obj._set_property(self._name, value)
+
+    def check_all(self, values) -> None:
+        if not all(map(isinstance, values, repeat(self._types))):
+            raise ValueError(f"Ошибка валидации свойства {self._name}: {self._error}")
+
+
+class WeakListenerRegistry:
+    def __init__(self) -> None:
+        self._refs: dict[tuple[int, int], weakref.ref] = {}
+        self._snapshot: tuple[weakref.ref, ...] = ()
+
+    @staticmethod
+    def _key(listener) -> tuple[int, int]:
+        if isinstance(listener, MethodType):
+            return id(listener.__self__), id(listener.__func__)
+        return id(listener), 0
+
+    def _make_ref(self, key: tuple[int, int], listener, weak: bool):
+        def prune(ref):
+            if self._refs.get(key) is ref:
+                del self._refs[key]
+                self._snapshot = tuple(self._refs.values())
+
+        if isinstance(listener, MethodType):
+            # связанный метод не должен продлевать жизнь своего объекта; обычная слабая ссылка
+            # на него умерла бы сразу, потому что метод создаётся заново при каждом обращении
+            return weakref.WeakMethod(listener, prune)
+        if weak:
+            return weakref.ref(listener, prune)
+        # по умолчанию слушатель держится сильной ссылкой: иначе Validator() или лямбда,
+        # на которые больше никто не ссылается, пропали бы сразу после подписки
+        return lambda: listener
+
+    def add(self, listener, weak: bool = False) -> None:
+        key = self._key(listener)
+        ref = self._refs.get(key)
+        if ref is not None and ref() is not None:
             return
-        self._rate = value
-        self._notify_changed('rate')
+        self._refs[key] = self._make_ref(key, listener, weak)
+        self._snapshot = tuple(self._refs.values())
 
-    @property
-    def availability(self) -> bool:
-        return self._availability
-
-    @availability.setter
-    def availability(self, value: bool) -> None:
-        if not isinstance(value, bool):
-            raise ValueError("Ошибка валидации свойства availability: значение должно быть True или False")
-        if not self._notify_changing('availability', self._availability, value):
+    def remove(self, listener) -> None:
+        if self._refs.pop(self._key(listener), None) is not None:
+            self._snapshot = tuple(self._refs.values())
+
+    def __contains__(self, listener) -> bool:
+        ref = self._refs.get(self._key(listener))
+        return ref is not None and ref() is not None
+
+    def __iter__(self):
+        # итерация идёт по снимку, поэтому подписка и отписка во время рассылки безопасны
+        for ref in self._snapshot:
+            listener = ref()
+            if listener is not None:
+                yield listener
+
+    def __len__(self) -> int:
+        return sum(1 for ref in self._snapshot if ref() is not None)
+
+
+class _ListenerIndex:
+    def __init__(self, names: tuple[str, ...]) -> None:
+        self._names = names
+        self._registries = {name: WeakListenerRegistry() for name in names}
+
+    def _targets(self, name: str | None) -> tuple[str, ...]:
+        if name is None:
+            return self._names
+        if name not in self._registries:
+            raise ValueError(f"Неизвестное свойство {name}")
+        return (name,)
+
+    def add(self, listener, name: str | None = None, weak: bool = False) -> None:
+        for target in self._targets(name):
+            self._registries[target].add(listener, weak)
+
+    def remove(self, listener, name: str | None = None) -> None:
+        for target in self._targets(name):
+            self._registries[target].remove(listener)
+
+    def get(self, name: str) -> WeakListenerRegistry:
+        return self._registries[name]
+
+    def listeners(self, name: str | None = None) -> dict[tuple[int, int], object]:
+        return {WeakListenerRegistry._key(listener): listener
+                for target in self._targets(name) for listener in self._registries[target]}
+
+
+class IChangeDispatcher(ABC):
+    @abstractmethod
+    def dispatch(self, obj, calls: tuple[Callable[[], object], ...]) -> None:
+        ...
+
+    @abstractmethod
+    async def drain(self) -> None:
+        ...
+
+    def close(self) -> None:
+        pass
+
+
+class SyncDispatcher(IChangeDispatcher):
+    def dispatch(self, obj, calls: tuple[Callable[[], object], ...]) -> None:
+        for call in calls:
+            call()
+
+    async def drain(self) -> None:
+        pass
+
+
+class ThreadPoolDispatcher(IChangeDispatcher):
+    def __init__(self, max_workers: int | None = None, capacity: int = 10000) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity должен быть положительным")
+        self._capacity = capacity
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix='ChangeDispatcher')
+        self._cond = threading.Condition()
+        # у каждого объекта своя очередь, которую разбирает не больше одного потока, — так сохраняется порядок
+        self._queues: dict[int, deque] = {}
+        self._pending = 0
+        self._closed = False
+        self._local = threading.local()
+        self.delivered = 0
+        self.errors = 0
+
+    def dispatch(self, obj, calls: tuple[Callable[[], object], ...]) -> None:
+        key = id(obj)
+        with self._cond:
+            # слушатель, меняющий объекты из рабочего потока, не ждёт, иначе пул может заблокировать сам себя
+            if not getattr(self._local, 'worker', False):
+                while self._pending >= self._capacity and not self._closed:
+                    self._cond.wait()
+            if self._closed:
+                raise RuntimeError("Диспетчер уведомлений закрыт")
+            self._pending += 1
+            queue = self._queues.get(key)
+            if queue is not None:
+                queue.append(calls)
+                return
+            self._queues[key] = deque((calls,))
+            # задача ставится под тем же замком, что и проверка _closed, чтобы close() не вклинился между ними
+            try:
+                self._executor.submit(self._run, key)
+            except BaseException:
+                del self._queues[key]
+                self._pending -= 1
+                self._cond.notify_all()
+                raise
+
+    def _run(self, key: int) -> None:
+        self._local.worker = True
+        while True:
+            with self._cond:
+                queue = self._queues[key]
+                if not queue:
+                    del self._queues[key]
+                    return
+                calls = queue.popleft()
+            errors = 0
+            for call in calls:
+                try:
+                    call()
+                except Exception:
+                    errors += 1
+            with self._cond:
+                self._pending -= 1
+                self.delivered += 1
+                self.errors += errors
+                self._cond.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        with self._cond:
+            return self._cond.wait_for(lambda: self._pending == 0, timeout)
+
+    async def drain(self) -> None:
+        await asyncio.to_thread(self.flush)
+
+    def close(self) -> None:
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._executor.shutdown(wait=True)
+
+
+class AsyncioDispatcher(IChangeDispatcher):
+    def __init__(self, loop: asyncio.AbstractEventLoop | None = None, capacity: int = 10000) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity должен быть положительным")
+        self._loop = loop if loop is not None else asyncio.get_running_loop()
+        self._capacity = capacity
+        self._cond = threading.Condition()
+        self._queues: dict[int, deque] = {}
+        self._pending = 0
+        self._closed = False
+        self._waiters: list[asyncio.Future] = []
+        self._tasks: set[asyncio.Task] = set()
+        self.delivered = 0
+        self.errors = 0
+
+    def _in_loop(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def dispatch(self, obj, calls: tuple[Callable[[], object], ...]) -> None:
+        key = id(obj)
+        in_loop = self._in_loop()
+        with self._cond:
+            # в потоке цикла ждать нельзя: там, как и у StreamWriter, ограничителем служит await drain()
+            if not in_loop:
+                while self._pending >= self._capacity and not self._closed:
+                    self._cond.wait()
+            if self._closed:
+                raise RuntimeError("Диспетчер уведомлений закрыт")
+            self._pending += 1
+            queue = self._queues.get(key)
+            if queue is not None:
+                queue.append(calls)
+                return
+            self._queues[key] = deque((calls,))
+        if in_loop:
+            self._start(key)
+        else:
+            self._loop.call_soon_threadsafe(self._start, key)
+
+    def _start(self, key: int) -> None:
+        task = self._loop.create_task(self._run(key))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, key: int) -> None:
+        while True:
+            with self._cond:
+                queue = self._queues[key]
+                if not queue:
+                    del self._queues[key]
+                    return
+                calls = queue.popleft()
+            for call in calls:
+                try:
+                    result = call()
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception:
+                    self.errors += 1
+            with self._cond:
+                self._pending -= 1
+                self.delivered += 1
+                self._cond.notify_all()
+                waiters = self._waiters if self._pending == 0 else []
+                if waiters:
+                    self._waiters = []
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+
+    async def drain(self) -> None:
+        with self._cond:
+            if self._pending == 0:
+                return
+            waiter = self._loop.create_future()
+            self._waiters.append(waiter)
+        await waiter
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+SYNC_DISPATCHER = SyncDispatcher()
+
+
+def _check_listener(listener, method: str) -> None:
+    # кроме объектов-слушателей принимаются функции и связанные методы с той же сигнатурой
+    if not hasattr(listener, method) and not callable(listener):
+        raise TypeError(f"Слушатель должен реализовывать {method} или быть вызываемым объектом")
+
+
+class ObservableObject:
+    _observable_properties: tuple[str, ...] = ()
+    _dispatcher: IChangeDispatcher = SYNC_DISPATCHER
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        names = dict.fromkeys(name for klass in reversed(cls.__mro__)
+                              for name, attr in vars(klass).items()
+                              if isinstance(attr, ObservableProperty))
+        cls._observable_properties = tuple(names)
+
+    def __init__(self) -> None:
+        self._changing_listeners = _ListenerIndex(self._observable_properties)
+        self._changed_listeners = _ListenerIndex(self._observable_properties)
+        self._pending: dict[str, object] | None = None
+
+    def _set_property(self, name: str, value) -> None:
+        if self._pending is not None:
+            self._pending[name] = value
+            return
+        if not self._notify_changing(name, getattr(self, '_' + name), value):
             return
-        self._availability = value
-        self._notify_changed('availability')
+        setattr(self, '_' + name, value)
+        self._notify_changed(name)
+
+    def batch_update(self) -> 'ChangeTransaction':
+        return ChangeTransaction(self)
 
     def _notify_changing(self, name: str, old, new) -> bool:
-        for listener in self._changing_listeners:
-            if not listener.on_property_changing(self, name, old, new):
+        for listener in self._changing_listeners.get(name):
+            if not getattr(listener, 'on_property_changing', listener)(self, name, old, new):
                 return False
         return True
 
+    def set_dispatcher(self, dispatcher: IChangeDispatcher) -> None:
+        self._dispatcher = dispatcher
+
     def _notify_changed(self, name: str) -> None:
-        for listener in self._changed_listeners:
-            listener.on_property_changed(self, name)
+        calls = tuple(partial(getattr(listener, 'on_property_changed', listener), self, name)
+                      for listener in self._changed_listeners.get(name))
+        if calls:
+            self._dispatcher.dispatch(self, calls)
+
+    def _notify_changed_many(self, names: tuple[str, ...]) -> None:
+        interested: dict[tuple[int, int], tuple[object, list[str]]] = {}
+        for name in names:
+            for listener in self._changed_listeners.get(name):
+                key = WeakListenerRegistry._key(listener)
+                interested.setdefault(key, (listener, []))[1].append(name)
+        calls = []
+        for listener, listener_names in interested.values():
+            if hasattr(listener, 'on_properties_changed'):
+                calls.append(partial(listener.on_properties_changed, self, tuple(listener_names)))
+            else:
+                # слушатель без пакетного метода получает по уведомлению на каждое поле
+                callback = getattr(listener, 'on_property_changed', listener)
+                calls.extend(partial(callback, self, name) for name in listener_names)
+        if calls:
+            self._dispatcher.dispatch(self, tuple(calls))
+
+    def add_property_changing_listener(self, listener: IPropertyChangingListener,
+                                       property_name: str | None = None) -> None:
+        _check_listener(listener, 'on_property_changing')
+        self._changing_listeners.add(listener, property_name)
 
-    def add_property_changing_listener(self, listener: IPropertyChangingListener['Product']) -> None:
-        if listener not in self._changing_listeners:
-            self._changing_listeners.append(listener)
+    def remove_property_changing_listener(self, listener: IPropertyChangingListener,
+                                          property_name: str | None = None) -> None:
+        self._changing_listeners.remove(listener, property_name)
 
-    def remove_property_changing_listener(self, listener: IPropertyChangingListener['Product']) -> None:
-        if listener in self._changing_listeners:
-            self._changing_listeners.remove(listener)
+    def add_property_changed_listener(self, listener: IPropertyChangedListener,
+                                      property_name: str | None = None, weak: bool = False) -> None:
+        _check_listener(listener, 'on_property_changed')
+        self._changed_listeners.add(listener, property_name, weak)
 
-    def add_property_changed_listener(self, listener: IPropertyChangedListener['Product']) -> None:
-        if listener not in self._changed_listeners:
-            self._changed_listeners.append(listener)
+    def remove_property_changed_listener(self, listener: IPropertyChangedListener,
+                                         property_name: str | None = None) -> None:
+        self._changed_listeners.remove(listener, property_name)
+
+    def listener_count(self, property_name: str | None = None) -> int:
+        return len(self._changing_listeners.listeners(property_name).keys()
+                   | self._changed_listeners.listeners(property_name).keys())
+
+
+class Product(ObservableObject, INotifyDataChanging['Product'], IDataChanged['Product']):
+    price = ObservableProperty((int, float), "значение должно быть числом")
+    rate = ObservableProperty((int, float), "значение должно быть числом")
+    availability = ObservableProperty(bool, "значение должно быть True или False")
+
+    def __init__(self, price: float, rate: float, availability: bool) -> None:
+        super().__init__()
+        self._price = price
+        self._rate = rate
+        self._availability = availability
+
+class ChangeTransaction:
+    def __init__(self, *objects: ObservableObject) -> None:
+        self._objects = objects
+        self.committed: bool | None = None
+
+    def __enter__(self) -> 'ChangeTransaction':
+        for index, obj in enumerate(self._objects):
+            if obj._pending is not None:
+                for started in self._objects[:index]:
+                    started._pending = None
+                raise RuntimeError(f"Для объекта {obj} уже идёт пакетное обновление")
+            obj._pending = {}
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        staged = []
+        for obj in self._objects:
+            staged.append((obj, obj._pending))
+            obj._pending = None
+        if exc_type is not None:
+            self.committed = False
+            return False
+
+        # каждое поле проверяется один раз, с итоговым значением;
+        # один запрет отменяет всю транзакцию
+        for obj, changes in staged:
+            for name, value in changes.items():
+                if not obj._notify_changing(name, getattr(obj, '_' + name), value):
+                    self.committed = False
+                    return False
+
+        for obj, changes in staged:
+            for name, value in changes.items():
+                setattr(obj, '_' + name, value)
+        for obj, changes in staged:
+            if changes:
+                obj._notify_changed_many(tuple(changes))
+        self.committed = True
+        return False
 
-    def remove_property_changed_listener(self, listener: IPropertyChangedListener['Product']) -> None:
-        if listener in self._changed_listeners:
-            self._changed_listeners.remove(listener)
 
 class ChangeLogger(IPropertyChangedListener[Product]):
     def on_property_changed(self, obj: Product, property_name: str) -> None:
         print(f"[Изменено] {property_name} у объекта {obj} -> {getattr(obj, property_name)}")
 
-class Validator(IPropertyChangingListener[Product]):
+    def on_properties_changed(self, obj: Product, property_names: tuple[str, ...]) -> None:
+        changes = ', '.join(f"{name} -> {getattr(obj, name)}" for name in property_names)
+        print(f"[Изменено] {changes} у объекта {obj}")
+
+class IBulkValidator(ABC):
+    @abstractmethod
+    def reject_mask(self, property_name: str, values) -> bytes:
+        ...
+
+class Validator(IPropertyChangingListener[Product], IBulkValidator):
     def on_property_changing(self, obj: Product, property_name: str, old_value, new_value) -> bool:
         if property_name == 'price' and new_value < 0:
             print("Ошибка валидации: price не может быть отрицательной")
@@ -122,6 +510,240 @@ class Validator(IPropertyChangingListener[Product]):
             return False
         return True
 
+    def reject_mask(self, property_name: str, values) -> bytes:
+        # те же правила, что и в on_property_changing, но сразу для всего столбца
+        if property_name == 'price':
+            return bytes(map(lt, values, repeat(0)))
+        if property_name == 'rate':
+            return bytes(map(or_, map(lt, values, repeat(0)), map(gt, values, repeat(5))))
+        if property_name == 'availability':
+            return bytes(map(not_, map(isinstance, values, repeat(bool))))
+        return bytes(len(values))
+
+
+class IStoreChangedListener(ABC):
+    @abstractmethod
+    def on_rows_changed(self, store: 'ProductStore', property_name: str, rows: array) -> None:
+        ...
+
+
+def _column_property(name: str) -> property:
+    def getter(view: 'ProductView'):
+        return view._store._get(name, view._row)
+
+    def setter(view: 'ProductView', value) -> None:
+        view._store._columns[name][view._row] = value
+
+    return property(getter, setter)
+
+
+class ProductView(Product):
+    _price = _column_property('price')
+    _rate = _column_property('rate')
+    _availability = _column_property('availability')
+
+    def __init__(self, store: 'ProductStore', row: int) -> None:
+        ObservableObject.__init__(self)
+        self._store = store
+        self._row = row
+        self._dispatcher = store._dispatcher
+
+    @property
+    def row(self) -> int:
+        return self._row
+
+    def add_property_changing_listener(self, listener: IPropertyChangingListener,
+                                       property_name: str | None = None) -> None:
+        super().add_property_changing_listener(listener, property_name)
+        self._store._pinned[self._row] = self
+
+    def remove_property_changing_listener(self, listener: IPropertyChangingListener,
+                                          property_name: str | None = None) -> None:
+        super().remove_property_changing_listener(listener, property_name)
+        self._unpin()
+
+    def add_property_changed_listener(self, listener: IPropertyChangedListener,
+                                      property_name: str | None = None, weak: bool = False) -> None:
+        super().add_property_changed_listener(listener, property_name, weak)
+        self._store._pinned[self._row] = self
+
+    def remove_property_changed_listener(self, listener: IPropertyChangedListener,
+                                         property_name: str | None = None) -> None:
+        super().remove_property_changed_listener(listener, property_name)
+        self._unpin()
+
+    def _unpin(self) -> None:
+        if not self.listener_count():
+            self._store._pinned.pop(self._row, None)
+
+    def _notify_changing(self, name: str, old, new) -> bool:
+        if self._store._rejects(name, (new,)):
+            return False
+        return super()._notify_changing(name, old, new)
+
+    def _notify_changed(self, name: str) -> None:
+        super()._notify_changed(name)
+        self._store._publish(name, array('q', (self._row,)))
+
+    def _notify_changed_many(self, names: tuple[str, ...]) -> None:
+        super()._notify_changed_many(names)
+        for name in names:
+            self._store._publish(name, array('q', (self._row,)))
+
+    def __repr__(self):
+        return f"ProductView(row={self._row})"
+
+
+class ProductStore:
+    COLUMNS = ('price', 'rate', 'availability')
+
+    def __init__(self, products: Iterable[Product] = ()) -> None:
+        products = list(products)
+        self._columns = {
+            'price': array('d', map(attrgetter('price'), products)),
+            'rate': array('d', map(attrgetter('rate'), products)),
+            'availability': bytearray(map(attrgetter('availability'), products)),
+        }
+        # представления без слушателей живут, пока на них ссылается вызывающий код;
+        # хранилище удерживает только те, у которых есть подписки
+        self._views: weakref.WeakValueDictionary[int, ProductView] = weakref.WeakValueDictionary()
+        self._pinned: dict[int, ProductView] = {}
+        self._listeners = WeakListenerRegistry()
+        # проверки держатся сильными ссылками: молча пропавший валидатор пропустил бы некорректные данные
+        self._validators: list[IBulkValidator] = []
+        self._dispatcher: IChangeDispatcher = SYNC_DISPATCHER
+
+    def append(self, price: float, rate: float, availability: bool) -> int:
+        for name, value in zip(self.COLUMNS, (price, rate, availability)):
+            getattr(Product, name).check_all((value,))
+        self._columns['price'].append(price)
+        self._columns['rate'].append(rate)
+        self._columns['availability'].append(availability)
+        return len(self) - 1
+
+    def __len__(self) -> int:
+        return len(self._columns['price'])
+
+    def __getitem__(self, row: int) -> ProductView:
+        if not 0 <= row < len(self):
+            raise IndexError(f"Строка {row} вне диапазона")
+        view = self._views.get(row)
+        if view is None:
+            view = ProductView(self, row)
+            self._views[row] = view
+        return view
+
+    def __iter__(self) -> Iterator[ProductView]:
+        return map(self.__getitem__, range(len(self)))
+
+    def _column(self, name: str):
+        column = self._columns.get(name)
+        if column is None:
+            raise ValueError(f"Неизвестное свойство {name}")
+        return column
+
+    def _get(self, name: str, row: int):
+        value = self._columns[name][row]
+        return bool(value) if name == 'availability' else value
+
+    def column(self, name: str) -> memoryview:
+        return memoryview(self._column(name)).toreadonly()
+
+    def where(self, name: str, op: Callable[[object, object], bool], value) -> bytes:
+        return bytes(map(op, self._column(name), repeat(value)))
+
+    def set_dispatcher(self, dispatcher: IChangeDispatcher) -> None:
+        self._dispatcher = dispatcher
+        for view in list(self._views.values()):
+            view.set_dispatcher(dispatcher)
+
+    def add_validator(self, validator: IBulkValidator) -> None:
+        if not isinstance(validator, IBulkValidator):
+            raise TypeError("Ожидается объект типа IBulkValidator")
+        if validator not in self._validators:
+            self._validators.append(validator)
+
+    def remove_validator(self, validator: IBulkValidator) -> None:
+        if validator in self._validators:
+            self._validators.remove(validator)
+
+    def add_rows_changed_listener(self, listener: IStoreChangedListener, weak: bool = False) -> None:
+        _check_listener(listener, 'on_rows_changed')
+        self._listeners.add(listener, weak)
+
+    def remove_rows_changed_listener(self, listener: IStoreChangedListener) -> None:
+        self._listeners.remove(listener)
+
+    def _reject_mask(self, name: str, values) -> bytes | None:
+        mask = None
+        for validator in self._validators:
+            rejected = validator.reject_mask(name, values)
+            mask = rejected if mask is None else bytes(map(or_, mask, rejected))
+        return mask if mask is not None and any(mask) else None
+
+    def _rejects(self, name: str, values) -> bool:
+        return self._reject_mask(name, values) is not None
+
+    def _publish(self, name: str, rows: array) -> None:
+        calls = tuple(partial(getattr(listener, 'on_rows_changed', listener), self, name, rows)
+                      for listener in self._listeners)
+        if calls:
+            self._dispatcher.dispatch(self, calls)
+
+    def _views_in(self, rows: array) -> list[tuple[int, ProductView]]:
+        # уведомлять нужно только представления с подписчиками; их обычно намного меньше, чем строк,
+        # поэтому они ищутся в отсортированном rows бинарным поиском
+        found = []
+        for row, view in list(self._pinned.items()):
+            # слабо подписанные слушатели могли исчезнуть, такое представление больше не нужно держать
+            if not view.listener_count():
+                del self._pinned[row]
+                continue
+            position = bisect_left(rows, row)
+            if position < len(rows) and rows[position] == row:
+                found.append((position, view))
+        found.sort(key=itemgetter(0))
+        return found
+
+    def update(self, name: str, func: Callable[[object], object], where: bytes | None = None) -> array:
+        column = self._column(name)
+        size = len(column)
+        if where is not None and len(where) != size:
+            raise ValueError(f"Длина маски {len(where)} не совпадает с числом строк {size}")
+        rows = array('q', range(size) if where is None else compress(range(size), where))
+        values = map(column.__getitem__, rows) if where is not None else column
+        if name == 'availability':
+            # в столбце лежат байты 0/1, а func, как и слушатели, должна видеть bool
+            values = map(bool, values)
+        new = list(map(func, values))
+        getattr(Product, name).check_all(new)
+
+        # строки, не прошедшие проверку, остаются без изменений, как и при отклонённой записи через сеттер
+        keep = None
+        rejected = self._reject_mask(name, new)
+        if rejected is not None:
+            keep = bytearray(map(not_, rejected))
+        for position, view in self._views_in(rows):
+            if keep is None or keep[position]:
+                if not ObservableObject._notify_changing(view, name, self._get(name, view.row), new[position]):
+                    if keep is None:
+                        keep = bytearray(repeat(1, len(rows)))
+                    keep[position] = 0
+        if keep is not None:
+            rows = array('q', compress(rows, keep))
+            new = list(compress(new, keep))
+
+        if len(rows) == size:
+            column[:] = array(column.typecode, new) if isinstance(column, array) else bytearray(new)
+        else:
+            for row, value in zip(rows, new):
+                column[row] = value
+        if rows:
+            for _, view in self._views_in(rows):
+                ObservableObject._notify_changed(view, name)
+            self._publish(name, rows)
+        return rows
+
 if __name__ == '__main__':
     p = Product(10.0, 3.5, True)
     logger = ChangeLogger()
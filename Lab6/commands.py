@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from system_controller import SystemController
+from Lab3.Lab3 import LogLevel
 from dataclasses import dataclass
 
 @dataclass
@@ -33,11 +34,11 @@ class VolumeUpCommand(Command):
 
     def execute(self) -> None:
         self.system_controller.volume = min(100, self.system_controller.volume + self.step)
-        self.system_controller.log(f'volume increased +{self.step}%')
+        self.system_controller.log('volume increased +%d%%', self.step)
 
     def undo(self) -> None:
         self.system_controller.volume = max(0, self.system_controller.volume - self.step)
-        self.system_controller.log(f'volume decreased +{self.step}%')
+        self.system_controller.log('volume decreased +%d%%', self.step)
 
     def get_type(self) -> str:
         return 'VolumeUp'
@@ -53,11 +54,11 @@ class VolumeDownCommand(Command):
 
     def execute(self) -> None:
         self.system_controller.volume = max(0, self.system_controller.volume - self.step)
-        self.system_controller.log(f'volume decreased +{self.step}%')
+        self.system_controller.log('volume decreased +%d%%', self.step)
 
     def undo(self) -> None:
         self.system_controller.volume = min(100, self.system_controller.volume + self.step)
-        self.system_controller.log(f'volume increased +{self.step}%')
+        self.system_controller.log('volume increased +%d%%', self.step)
 
     def get_type(self) -> str:
         return 'VolumeDown'
@@ -97,11 +98,11 @@ class KeyCommand(Command):
     def execute(self) -> None:
         self.prev = self.system_controller.text
         self.system_controller.text += self.char
-        self.system_controller.log(self.system_controller.text)
+        self.system_controller.log(self.system_controller.text, level=LogLevel.DEBUG)
 
     def undo(self) -> None:
         self.system_controller.text = self.prev
-        self.system_controller.log(self.system_controller.text)
+        self.system_controller.log(self.system_controller.text, level=LogLevel.DEBUG)
 
     def get_type(self) -> str:
         return 'Key'
@@ -1,4 +1,5 @@
-from Lab3.Lab3 import Logger, ConsoleLogHandler, FileLogHandler, SimpleLogFilter
+from Lab3.Lab3 import ConsoleLogHandler, FileLogHandler, SimpleLogFilter
+from Lab3.async_logger import AsyncLogger
 from Lab5.serializer import DataclassJsonSerializer
 from system_controller import SystemController
 from keyboard import VirtualKeyboard
@@ -7,7 +8,7 @@ from state_saver import KeyboardStateSaver, Binding
 def main() -> None:
     handlers = [ConsoleLogHandler(), FileLogHandler('keyboard_logger.txt')]
     filters = [SimpleLogFilter('')]
-    logger = Logger(handlers, filters)
+    logger = AsyncLogger(handlers, filters)
     system_controller = SystemController(logger)
     keyboard = VirtualKeyboard(system_controller)
     saver = KeyboardStateSaver(DataclassJsonSerializer(Binding))
@@ -31,6 +32,7 @@ def main() -> None:
     keyboard.undo()
     keyboard.undo()
     saver.save(keyboard, 'keyboard_info.json')
+    logger.close()
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
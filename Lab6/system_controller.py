@@ -1,4 +1,4 @@
-from Lab3.Lab3 import Logger
+from Lab3.Lab3 import Logger, LogLevel
 
 class SystemController:
     def __init__(self, logger: Logger):
@@ -7,5 +7,5 @@ class SystemController:
         self.media_playing = False
         self.logger = logger
 
-    def log(self, message: str):
-        self.logger.log(message)
\ No newline at end of file
+    def log(self, message: str, *args, level: LogLevel = LogLevel.INFO):
+        self.logger.log(message, *args, level=level)
\ No newline at end of file
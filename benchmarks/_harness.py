@@ -0,0 +1,96 @@
+import argparse
+import json
+import platform
+import sys
+import timeit
+from time import perf_counter_ns
+from typing import Callable
+
+
+def add_arguments(parser: argparse.ArgumentParser, sizes: list[int]) -> None:
+    parser.add_argument('--sizes', type=int, nargs='+', default=sizes,
+                        help='размеры пакетов')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='число повторов, берётся лучший результат')
+    parser.add_argument('--output', help='файл для JSON с результатами')
+    parser.add_argument('--baseline', help='JSON предыдущего прогона для сравнения')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='допустимое замедление относительно baseline (0.10 = 10%%)')
+
+
+def measure(func: Callable[[], object], ops: int, repeat: int) -> dict:
+    func()
+    timings = timeit.repeat(func, number=1, repeat=repeat)
+    return {
+        'ops': ops,
+        'best_ns_per_op': min(timings) / ops * 1e9,
+        'mean_ns_per_op': sum(timings) / len(timings) / ops * 1e9,
+    }
+
+
+def measure_latency(func: Callable[[], object], ops: int, repeat: int) -> dict:
+    func()
+    samples = []
+    totals = []
+    for _ in range(repeat):
+        start_total = perf_counter_ns()
+        for _ in range(ops):
+            start = perf_counter_ns()
+            func()
+            samples.append(perf_counter_ns() - start)
+        totals.append(perf_counter_ns() - start_total)
+    samples.sort()
+    best = min(totals) / ops
+    return {
+        'ops': ops,
+        'best_ns_per_op': best,
+        'mean_ns_per_op': sum(totals) / len(totals) / ops,
+        'p50_ns': samples[len(samples) // 2],
+        'p99_ns': samples[min(len(samples) - 1, len(samples) * 99 // 100)],
+        'records_per_sec': 1e9 / best if best else 0.0,
+    }
+
+
+def report(results: dict) -> dict:
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    regressions = []
+    for name, result in current['results'].items():
+        old = baseline.get('results', {}).get(name)
+        if old is None:
+            continue
+        ratio = result['best_ns_per_op'] / old['best_ns_per_op']
+        if ratio > 1 + threshold:
+            regressions.append(f"{name}: {old['best_ns_per_op']:.1f} -> "
+                               f"{result['best_ns_per_op']:.1f} нс/оп (x{ratio:.2f})")
+    return regressions
+
+
+def finish(args: argparse.Namespace, results: dict) -> int:
+    data = report(results)
+    for name, result in results.items():
+        line = f"{name:40s} {result['best_ns_per_op']:12.1f} нс/оп"
+        if 'p50_ns' in result:
+            line += (f"  {result['records_per_sec']:12,.0f} зап/с"
+                     f"  p50 {result['p50_ns']:9,d} нс  p99 {result['p99_ns']:9,d} нс")
+        print(line)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(data, baseline, args.threshold)
+        if regressions:
+            print("Обнаружено замедление:", file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            return 1
+    return 0
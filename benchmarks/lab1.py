@@ -0,0 +1,86 @@
+# Запуск из корня репозитория: python -m benchmarks.lab1 --output lab1.json
+# Сравнение с прошлым прогоном: python -m benchmarks.lab1 --baseline lab1.json
+import argparse
+import random
+import sys
+
+from Lab1 import Vector2d, Vector2dArray
+from benchmarks._harness import add_arguments, measure, finish
+
+
+def make_cases(size: int) -> dict:
+    rnd = random.Random(size)
+    coords = [(rnd.randint(0, 12), rnd.randint(0, 24)) for _ in range(size)]
+    vectors = [Vector2d(x, y) for x, y in coords]
+    # (2, 1) x (1, 2) даёт положительное векторное произведение, укладывающееся в сетку
+    left = [Vector2d(2, 1)] * size
+    right = [Vector2d(1, 2)] * size
+    pairs = list(zip(vectors, vectors[::-1]))
+    array = Vector2dArray.from_vectors(vectors)
+
+    def construct():
+        for x, y in coords:
+            Vector2d(x, y)
+
+    def dot_static():
+        for a, b in pairs:
+            Vector2d.dot_static(a, b)
+
+    def dot_dynamic():
+        for a, b in pairs:
+            a.dot_dynamic(b)
+
+    def cross_static():
+        for a, b in zip(left, right):
+            Vector2d.cross_static(a, b)
+
+    def cross_dynamic():
+        for a, b in zip(left, right):
+            a.cross_dynamic(b)
+
+    def mixed_product():
+        for v, a, b in zip(vectors, left, right):
+            Vector2d.mixed_product(v, a, b)
+
+    def absolute():
+        for v in vectors:
+            abs(v)
+
+    def iterate():
+        for v in vectors:
+            for _ in v:
+                pass
+
+    def array_dot():
+        array.dot(array)
+
+    def array_abs():
+        abs(array)
+
+    return {
+        'Vector2d()': construct,
+        'dot_static': dot_static,
+        'dot_dynamic': dot_dynamic,
+        'cross_static': cross_static,
+        'cross_dynamic': cross_dynamic,
+        'mixed_product': mixed_product,
+        '__abs__': absolute,
+        '__iter__': iterate,
+        'Vector2dArray.dot': array_dot,
+        'Vector2dArray.__abs__': array_abs,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Бенчмарки примитивов Lab1")
+    add_arguments(parser, [100, 10_000, 100_000])
+    args = parser.parse_args(argv)
+    results = {}
+    for size in args.sizes:
+        for name, func in make_cases(size).items():
+            results[f"{name}/{size}"] = measure(func, size, args.repeat)
+    return finish(args, results)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+# Запуск из корня репозитория: python -m benchmarks.lab3 --output lab3.json
+# Сравнение с прошлым прогоном: python -m benchmarks.lab3 --baseline lab3.json
+import argparse
+import contextlib
+import os
+import sys
+import tempfile
+
+from Lab3.Lab3 import (ConsoleLogHandler, FileLogHandler, ILogHandler, Logger,
+                       ReLogFilter, SimpleLogFilter)
+from Lab3.filter_chain import CompiledFilterChain
+from benchmarks._harness import add_arguments, measure_latency, finish
+
+
+class NullLogHandler(ILogHandler):
+    def handle(self, text: str) -> None:
+        pass
+
+
+def make_cases(tmp_dir: str) -> dict:
+    simple_filters = [SimpleLogFilter('x'), SimpleLogFilter('xx'), SimpleLogFilter(''), SimpleLogFilter('x' * 4)]
+    regex_filters = [ReLogFilter(r'^x+$'), ReLogFilter(r'(x)\1')]
+    return {
+        'console(/dev/null)': lambda: Logger([ConsoleLogHandler()], []),
+        'file': lambda: Logger([FileLogHandler(os.path.join(tmp_dir, 'plain.log'))], []),
+        'file(buffered)': lambda: Logger([FileLogHandler(os.path.join(tmp_dir, 'buffered.log'),
+                                                         buffered=True)], []),
+        'simple_filters x4': lambda: Logger([NullLogHandler()], simple_filters),
+        'regex_filters x2': lambda: Logger([NullLogHandler()], regex_filters),
+        'compiled_chain': lambda: Logger([NullLogHandler()],
+                                         [CompiledFilterChain(simple_filters + regex_filters)]),
+        'fan_out x1': lambda: Logger([NullLogHandler()], []),
+        'fan_out x4': lambda: Logger([NullLogHandler() for _ in range(4)], []),
+        'fan_out x16': lambda: Logger([NullLogHandler() for _ in range(16)], []),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Бенчмарки Logger из Lab3")
+    add_arguments(parser, [16, 256, 4096])
+    parser.add_argument('--records', type=int, default=2000, help='записей на один повтор')
+    args = parser.parse_args(argv)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir, open(os.devnull, 'w') as devnull:
+        for size in args.sizes:
+            message = 'x' * size
+            for name, factory in make_cases(tmp_dir).items():
+                logger = factory()
+                with contextlib.redirect_stdout(devnull):
+                    results[f"{name}/{size}B"] = measure_latency(lambda: logger.log(message),
+                                                                 args.records, args.repeat)
+                logger.close()
+    return finish(args, results)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+# Запуск из корня репозитория: python -m benchmarks.point_index
+import random
+import timeit
+
+from Lab1 import Grid, DEFAULT_GRID, Point2d, PointIndex
+
+POINTS = 20000
+QUERIES = 200
+
+
+def naive_within(points, center, radius):
+    r2 = radius * radius
+    return [p for p in points if (p.x - center.x) ** 2 + (p.y - center.y) ** 2 <= r2]
+
+
+def naive_nearest(points, center, k):
+    return sorted(points, key=lambda p: (p.x - center.x) ** 2 + (p.y - center.y) ** 2)[:k]
+
+
+def naive_rect(points, start, end):
+    return [p for p in points if start.x <= p.x <= end.x and start.y <= p.y <= end.y]
+
+
+def run(grid: Grid) -> None:
+    rnd = random.Random(42)
+    point_cls = grid.bind(Point2d)
+
+    def random_point():
+        return point_cls(rnd.randint(0, grid.width), rnd.randint(0, grid.height))
+
+    points = [random_point() for _ in range(POINTS)]
+    centers = [random_point() for _ in range(QUERIES)]
+    radius = max(grid.width, grid.height) / 10
+    corner = point_cls(grid.width // 2, grid.height // 2)
+    index = PointIndex(points, grid)
+
+    cases = [
+        ('within', lambda: [naive_within(points, c, radius) for c in centers],
+         lambda: [index.within(c, radius) for c in centers]),
+        ('nearest k=5', lambda: [naive_nearest(points, c, 5) for c in centers],
+         lambda: [index.nearest(c, 5) for c in centers]),
+        ('in_rect', lambda: [naive_rect(points, c, corner) for c in centers],
+         lambda: [index.in_rect(c, corner) for c in centers]),
+    ]
+    print(f"{grid!r}, {POINTS} точек, {QUERIES} запросов")
+    for name, naive, indexed in cases:
+        naive_time = min(timeit.repeat(naive, number=1, repeat=3))
+        index_time = min(timeit.repeat(indexed, number=1, repeat=3))
+        print(f"  {name:12s} перебор {naive_time * 1e3:9.2f} мс  "
+              f"индекс {index_time * 1e3:9.2f} мс  x{naive_time / index_time:.1f}")
+
+
+if __name__ == "__main__":
+    run(DEFAULT_GRID)
+    run(Grid(10000, 10000))
@@ -0,0 +1,41 @@
+# Запуск из корня репозитория: python -m benchmarks.screen
+import io
+import timeit
+
+from Lab2.Lab2 import Color, Printer
+from Lab2.screen import Screen
+
+FRAMES = 200
+LETTERS = 'АБВГДЕЖЗИКЛМН'
+
+
+def frames():
+    for tick in range(FRAMES):
+        # меняется одна буква из трёх и время от времени цвет
+        text = 'АБ' + LETTERS[tick % len(LETTERS)]
+        color = Color.GREEN if (tick // 50) % 2 == 0 else Color.YELLOW
+        yield text, color
+
+
+def full_repaint() -> int:
+    total = 0
+    for text, color in frames():
+        total += len(Printer.render_to_string(text, color, (5, 3), '*').encode('utf-8'))
+    return total
+
+
+def differential() -> int:
+    screen = Screen(80, 24, io.StringIO())
+    screen.present()
+    for text, color in frames():
+        screen.clear()
+        screen.draw_text(text, (5, 3), color, '*')
+        screen.present()
+    return screen.bytes_written
+
+
+if __name__ == "__main__":
+    for name, func in [('полная перерисовка', full_repaint), ('дифференциальная', differential)]:
+        total = func()
+        seconds = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"{name:20s} {total / FRAMES:8.1f} байт/кадр  {seconds / FRAMES * 1e6:8.1f} мкс/кадр")
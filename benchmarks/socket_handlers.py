@@ -0,0 +1,74 @@
+# Запуск из корня репозитория: python -m benchmarks.socket_handlers
+import os
+import socket
+import tempfile
+import threading
+import time
+
+from Lab3.Lab3 import SocketHandler, SyslogHandler, Transport
+
+RECORDS = 100_000
+MESSAGE = 'x' * 100
+
+
+class Listener:
+    def __init__(self, family: int, kind: int, address) -> None:
+        self.received = 0
+        self._sock = socket.socket(family, kind)
+        if kind == socket.SOCK_DGRAM:
+            self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 23)
+        self._sock.bind(address)
+        self.address = self._sock.getsockname()
+        if kind == socket.SOCK_STREAM:
+            self._sock.listen()
+            target = self._serve_stream
+        else:
+            target = self._serve_datagrams
+        self._thread = threading.Thread(target=target, daemon=True)
+        self._thread.start()
+
+    def _serve_stream(self) -> None:
+        conn, _ = self._sock.accept()
+        with conn:
+            while data := conn.recv(1 << 16):
+                self.received += data.count(b'\n')
+
+    def _serve_datagrams(self) -> None:
+        while True:
+            data = self._sock.recv(1 << 16)
+            # syslog присылает по одной записи на датаграмму без перевода строки
+            self.received += data.count(b'\n') or 1
+
+    def wait(self, expected: int, timeout: float = 5.0) -> None:
+        deadline = time.monotonic() + timeout
+        while self.received < expected and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+
+def run(name: str, listener: Listener, handler: SocketHandler) -> None:
+    start = time.perf_counter()
+    for _ in range(RECORDS):
+        handler.handle(MESSAGE)
+    enqueued = time.perf_counter() - start
+    handler.flush(60)
+    listener.wait(RECORDS - handler.dropped)
+    total = time.perf_counter() - start
+    handler.close()
+    print(f"{name:12s} постановка {RECORDS / enqueued:12,.0f} зап/с   "
+          f"доставка {listener.received / total:12,.0f} зап/с   "
+          f"получено {listener.received}/{RECORDS}")
+
+
+if __name__ == "__main__":
+    tcp = Listener(socket.AF_INET, socket.SOCK_STREAM, ('127.0.0.1', 0))
+    run('tcp', tcp, SocketHandler(tcp.address, Transport.TCP, backlog=RECORDS))
+
+    udp = Listener(socket.AF_INET, socket.SOCK_DGRAM, ('127.0.0.1', 0))
+    run('udp', udp, SocketHandler(udp.address, Transport.UDP, backlog=RECORDS))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        unix = Listener(socket.AF_UNIX, socket.SOCK_STREAM, os.path.join(tmp, 'stream.sock'))
+        run('unix', unix, SocketHandler(unix.address, Transport.UNIX, backlog=RECORDS))
+
+        dev_log = Listener(socket.AF_UNIX, socket.SOCK_DGRAM, os.path.join(tmp, 'log.sock'))
+        run('syslog', dev_log, SyslogHandler(dev_log.address, backlog=RECORDS))